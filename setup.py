@@ -13,6 +13,10 @@ setup(
         "python-dotenv>=1.0.0,<2.0.0",
         "requests>=2.30.0,<3.0.0",
     ],
+    extras_require={
+        "fast": ["orjson>=3.9.0"],
+        "metrics": ["prometheus_client>=0.17.0"],
+    },
     python_requires=">=3.10",
     entry_points={
         "console_scripts": [
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+# Use uv run pytest test_server_tools.py to run these tests
+"""
+Unit tests for the MCP server's batching and background deletion helpers.
+A stub stands in for the TickTick client, so no credentials are needed.
+"""
+
+import asyncio
+import json
+from collections import deque
+
+import pytest
+
+from ticktick_mcp.src import server
+
+class StubClient:
+    """Answers the client calls the tested tools make."""
+    delete_concurrency = 2
+    
+    def __init__(self):
+        self.deleted = []
+    
+    def get_project_with_data(self, project_id):
+        return {"project": {"id": project_id, "name": "Work"},
+                "tasks": [{"id": f"t{i}", "title": f"Task {i}"} for i in range(3)]}
+    
+    def delete_project(self, project_id):
+        self.deleted.append(project_id)
+        if project_id == "missing":
+            return {"error": "Project not found."}
+        return {"status": "success"}
+
+@pytest.fixture
+def stub(monkeypatch):
+    stub = StubClient()
+    monkeypatch.setattr(server, "ticktick", stub)
+    monkeypatch.setattr(server, "_client_ready", True)
+    monkeypatch.setattr(server, "_delete_queue", None)
+    monkeypatch.setattr(server, "_delete_worker_task", None)
+    monkeypatch.setattr(server, "_delete_jobs", {})
+    return stub
+
+def test_batch_execute_rejects_unknown_tools(stub):
+    result = asyncio.run(server.batch_execute([{"tool": "no_such_tool"}]))
+    
+    assert result.startswith("❌ Invalid operation at position 0: unknown tool 'no_such_tool'")
+
+def test_batch_execute_reports_bad_arguments_and_continues(stub):
+    result = asyncio.run(server.batch_execute([
+        {"tool": "get_delete_status", "args": {"job": "x"}},
+        {"tool": "get_delete_status", "args": {"job_id": "x"}},
+    ]))
+    
+    assert "❌ Invalid arguments for get_delete_status" in result
+    assert "No deletion job found with ID x." in result
+
+def test_background_project_deletes_get_distinct_job_ids(stub):
+    async def run():
+        job_ids = [server._enqueue_project_delete(project_id) for project_id in ("p1", "p2", "missing")]
+        await server._delete_queue.join()
+        server._delete_worker_task.cancel()
+        return job_ids
+    
+    job_ids = asyncio.run(run())
+    
+    assert len(set(job_ids)) == 3
+    assert [server._delete_jobs[job_id]["status"] for job_id in job_ids] == ["succeeded", "succeeded", "failed"]
+    assert server._delete_jobs[job_ids[2]]["error"] == "Project not found."
+    assert stub.deleted == ["p1", "p2", "missing"]
+
+def test_result_handles_are_pruned_to_the_newest_files(monkeypatch, tmp_path):
+    monkeypatch.setattr(server, "_result_dir", str(tmp_path))
+    monkeypatch.setattr(server, "_result_files", deque())
+    monkeypatch.setattr(server, "_MAX_RESULT_FILES", 2)
+    
+    handles = [json.loads(server._write_result_handle([{"id": str(i)}]))["handle"] for i in range(3)]
+    
+    assert sorted(str(path) for path in tmp_path.iterdir()) == sorted(handles[1:])
+
+def test_iso_dates_must_name_real_times():
+    assert server._is_valid_iso("2024-05-07T10:00:00+0000")
+    assert server._is_valid_iso("2024-05-07T10:00:00.000Z")
+    assert not server._is_valid_iso("2024-13-45T99:99:99+0000")
+    assert not server._is_valid_iso("2024-05-07")
+
+def test_summary_only_is_not_handed_off_as_a_file(stub, monkeypatch, tmp_path):
+    monkeypatch.setattr(server, "_LARGE_RESULT_TASKS", 2)
+    monkeypatch.setattr(server, "_result_dir", str(tmp_path))
+    monkeypatch.setattr(server, "_result_files", deque())
+    
+    summary = asyncio.run(server.get_project_tasks("p1", summary_only=True))
+    detailed = asyncio.run(server.get_project_tasks("p1"))
+    
+    assert summary.startswith("Found 3 tasks in project 'Work'")
+    assert "Detailed task information" not in summary
+    assert json.loads(detailed)["count"] == 3
+
+def test_finished_delete_jobs_are_evicted_oldest_first(stub, monkeypatch):
+    monkeypatch.setattr(server, "_MAX_DELETE_JOBS", 2)
+    
+    async def run():
+        first = server._enqueue_project_delete("p1")
+        await server._delete_queue.join()
+        second = server._enqueue_project_delete("p2")
+        third = server._enqueue_project_delete("p3")
+        await server._delete_queue.join()
+        server._delete_worker_task.cancel()
+        return first, second, third
+    
+    first, second, third = asyncio.run(run())
+    
+    assert list(server._delete_jobs) == [second, third]
+    assert all(job["status"] == "succeeded" for job in server._delete_jobs.values())
@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+# Use uv run pytest test_ticktick_client.py to run these tests
+"""
+Unit tests for the TickTick client's request pacing and caching helpers.
+These run offline and never contact the TickTick API.
+"""
+
+import threading
+import time
+
+import pytest
+import requests
+
+from ticktick_mcp.src.ticktick_client import TickTickClient, _CircuitBreaker, _RateLimiter
+
+@pytest.fixture
+def credentials(monkeypatch):
+    """Dummy credentials so TickTickClient() never reads a real .env file."""
+    for key in ("TICKTICK_CLIENT_ID", "TICKTICK_CLIENT_SECRET",
+                "TICKTICK_ACCESS_TOKEN", "TICKTICK_REFRESH_TOKEN"):
+        monkeypatch.setenv(key, "test")
+
+@pytest.fixture
+def client(credentials, monkeypatch):
+    """A client whose requests are answered by a stub."""
+    client = TickTickClient()
+    client.requests = []
+    
+    def make_request(method, endpoint, data=None, *args, **kwargs):
+        client.requests.append((method, endpoint))
+        if endpoint.endswith("/data"):
+            return {"project": {"id": "p1"}, "tasks": [{"id": "t1", "projectId": "p1", "title": "Task"}]}
+        return {"id": "p1", "name": "Project"}
+    
+    monkeypatch.setattr(client, "_make_request", make_request)
+    yield client
+    client.close()
+
+def _acquires_within(limiter, seconds):
+    """Return True if limiter.acquire() returns within the given time."""
+    thread = threading.Thread(target=limiter.acquire, daemon=True)
+    thread.start()
+    thread.join(seconds)
+    return not thread.is_alive()
+
+def test_rate_limiter_acquires_after_repeated_backoff():
+    limiter = _RateLimiter(5)
+    for _ in range(5):
+        limiter.backoff()
+    assert limiter.rate == 1.0
+    assert _acquires_within(limiter, 0.5)
+    assert _acquires_within(limiter, 2.0)
+
+def test_cached_reads_return_copies(client):
+    data = client.get_project_with_data("p1")
+    data["tasks"][0]["project_name"] = "Project"
+    
+    assert "project_name" not in client.get_project_with_data("p1")["tasks"][0]
+    assert len(client.requests) == 1
+
+def test_find_task_returns_a_copy_of_the_indexed_task(client):
+    task = client.find_task("p1", "t1")
+    task["task_ts"] = 0
+    
+    assert "task_ts" not in client.find_task("p1", "t1")
+    assert len(client.requests) == 1
+
+def _tripped_breaker():
+    breaker = _CircuitBreaker(failure_threshold=2, reset_timeout=0.05, success_threshold=2)
+    breaker.record(False)
+    breaker.record(False)
+    return breaker
+
+def test_circuit_breaker_opens_after_threshold():
+    breaker = _tripped_breaker()
+    assert breaker.retry_after() > 0
+
+def test_circuit_breaker_admits_one_probe_while_half_open():
+    breaker = _tripped_breaker()
+    time.sleep(0.06)
+    assert breaker.retry_after() == 0
+    assert breaker.retry_after() > 0
+    
+    # Each successful probe frees the slot; two close the circuit
+    breaker.record(True)
+    assert breaker.retry_after() == 0
+    breaker.record(True)
+    assert breaker.retry_after() == 0
+    assert breaker.retry_after() == 0
+
+def test_circuit_breaker_failed_probe_reopens():
+    breaker = _tripped_breaker()
+    time.sleep(0.06)
+    assert breaker.retry_after() == 0
+    breaker.record(False)
+    assert breaker.retry_after() > 0
+
+def test_rate_limiter_below_one_per_second_does_not_block_first_write():
+    assert _acquires_within(_RateLimiter(0.5), 0.5)
+
+def test_find_task_falls_back_to_get_task_for_unlisted_tasks(client):
+    task = client.find_task("p1", "t2")
+    
+    assert task["id"] == "p1"
+    assert client.requests == [("GET", "/project/p1/data"), ("GET", "/project/p1/task/t2")]
+
+def test_create_tasks_skips_duplicates(client, monkeypatch):
+    sent = []
+    
+    def make_request(method, endpoint, data=None, *args, **kwargs):
+        sent.append(data)
+        return {"add": [{"id": str(i), **task} for i, task in enumerate(data["add"])]}
+    
+    monkeypatch.setattr(client, "_make_request", make_request)
+    task = {"title": "Task", "project_id": "p1"}
+    tasks = [task, dict(task), {"title": "Other", "project_id": "p1"}]
+    
+    kept = client.create_tasks(tasks)
+    deduplicated = client.create_tasks(tasks, skip_duplicates=True)
+    
+    assert len(sent[0]["add"]) == 3
+    assert kept["skipped_duplicates"] == []
+    assert len(sent[1]["add"]) == 2
+    assert deduplicated["skipped_duplicates"] == [{"task_index": 1, "duplicate_of": 0}]
+    assert deduplicated["total_count"] == 3
+    assert deduplicated["message"] == "Successfully created 2 tasks in batch (1 duplicates skipped)"
+
+def _response(status_code, body=b"", etag=None):
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = body
+    if etag:
+        response.headers["ETag"] = etag
+    return response
+
+def test_get_revalidates_with_etag(credentials, monkeypatch):
+    client = TickTickClient()
+    sent_headers = []
+    responses = iter([_response(200, b'{"id": "p1", "name": "Project"}', '"v1"'), _response(304)])
+    
+    def request(method, url, data=None, headers=None, timeout=None):
+        sent_headers.append(headers)
+        return next(responses)
+    
+    monkeypatch.setattr(client._session, "request", request)
+    first = client._make_request("GET", "/project/p1")
+    first["name"] = "Changed"
+    second = client._make_request("GET", "/project/p1")
+    client.close()
+    
+    assert "If-None-Match" not in sent_headers[0]
+    assert sent_headers[1]["If-None-Match"] == '"v1"'
+    assert second["name"] == "Project"
+
+def test_save_tokens_updates_env_in_place(client, monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / ".env").write_text(
+        "# TickTick credentials\nTICKTICK_CLIENT_ID=id\nTICKTICK_ACCESS_TOKEN=old\nOTHER=value\n"
+    )
+    
+    client._save_tokens_to_env({"access_token": "new", "refresh_token": "refresh"})
+    
+    assert (tmp_path / ".env").read_text() == (
+        "# TickTick credentials\nTICKTICK_CLIENT_ID=id\nTICKTICK_ACCESS_TOKEN=new\nOTHER=value\n"
+        "TICKTICK_REFRESH_TOKEN=refresh\nTICKTICK_CLIENT_SECRET=test\n"
+    )
+
+def test_find_project_by_name_returns_a_copy(client, monkeypatch):
+    monkeypatch.setattr(client, "_fetch_projects", lambda: [{"id": "p1", "name": "Work"}, {"id": "p2", "name": "Home"}])
+    
+    project = client.find_project_by_name("Work")
+    project["name"] = "Changed"
+    
+    assert client.find_project_by_name("Work") == {"id": "p1", "name": "Work"}
+    assert client.find_project_by_name("Missing") is None
+
+def test_task_index_expires_before_the_general_cache(client, monkeypatch):
+    monkeypatch.setattr(TickTickClient, "_TASK_INDEX_TTL", 0.05)
+    client.find_task("p1", "t1")
+    client.find_task("p1", "t1")
+    time.sleep(0.06)
+    client.find_task("p1", "t1")
+    
+    assert client.requests == [("GET", "/project/p1/data")] * 2
+
+def test_unexpected_request_error_releases_the_probe(credentials, monkeypatch):
+    client = TickTickClient()
+    client._breaker = _tripped_breaker()
+    time.sleep(0.06)
+    
+    def request(*args, **kwargs):
+        raise requests.exceptions.TooManyRedirects("redirect loop")
+    
+    monkeypatch.setattr(client._session, "request", request)
+    result = client._make_request("GET", "/project")
+    client.close()
+    
+    assert result["error_code"] == "REQUEST_FAILED"
+    assert client._breaker.retry_after() == 0
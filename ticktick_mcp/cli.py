@@ -9,9 +9,6 @@ import argparse
 import logging
 from pathlib import Path
 
-from .src.server import main as server_main
-from .authenticate import main as auth_main
-
 def check_auth_setup() -> bool:
     """Check if authentication is set up properly."""
     # Check if .env file exists with the required credentials
@@ -66,6 +63,7 @@ Would you like to set up authentication now? (y/n): """, end="")
         choice = input().lower().strip()
         if choice == 'y':
             # Run the auth flow
+            from .authenticate import main as auth_main
             auth_result = auth_main()
             if auth_result != 0:
                 # Auth failed, exit
@@ -80,6 +78,7 @@ Run 'uv run -m ticktick_mcp.cli auth' to set up authentication later.
     # Run the appropriate command
     if args.command == "auth":
         # Run authentication flow
+        from .authenticate import main as auth_main
         sys.exit(auth_main())
     elif args.command == "run":
         # Configure logging based on debug flag
@@ -89,8 +88,9 @@ Run 'uv run -m ticktick_mcp.cli auth' to set up authentication later.
             format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
         )
         
-        # Start the server
+        # Start the server; the MCP stack is only imported for this command
         try:
+            from .src.server import main as server_main
             server_main()
         except KeyboardInterrupt:
             print("Server stopped by user", file=sys.stderr)
@@ -321,11 +321,11 @@ class TickTickAuth:
         
         if env_path.exists():
             with open(env_path, 'r') as f:
-                for line in f:
-                    line = line.strip()
-                    if line and not line.startswith('#') and '=' in line:
-                        key, value = line.split('=', 1)
-                        env_content[key] = value
+                env_content = {
+                    key: value
+                    for key, sep, value in (line.partition('=') for line in map(str.strip, f))
+                    if sep and key and not key.startswith('#')
+                }
         
         # Update with new tokens
         env_content["TICKTICK_ACCESS_TOKEN"] = self.tokens.get('access_token', '')
@@ -338,10 +338,11 @@ class TickTickAuth:
         if self.client_secret and "TICKTICK_CLIENT_SECRET" not in env_content:
             env_content["TICKTICK_CLIENT_SECRET"] = self.client_secret
         
-        # Write back to .env file
-        with open(env_path, 'w') as f:
-            for key, value in env_content.items():
-                f.write(f"{key}={value}\n")
+        # Write back to .env file in one go, swapping it in atomically
+        tmp_path = env_path.with_name(env_path.name + '.tmp')
+        with open(tmp_path, 'w') as f:
+            f.write("".join(f"{key}={value}\n" for key, value in env_content.items()))
+        os.replace(tmp_path, env_path)
         
         logger.info("Tokens saved to .env file")
 
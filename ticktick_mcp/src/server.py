@@ -1,205 +1,457 @@
 import asyncio
+import functools
+import inspect
 import json
 import os
 import logging
-import time
+import random
+import re
+import shutil
+import tempfile
+import uuid
+from collections import deque
 from datetime import datetime, timezone, timedelta
 from typing import Dict, List, Any, Optional
 
 from mcp.server.fastmcp import FastMCP
 from dotenv import load_dotenv
 
-from .ticktick_client import TickTickClient
+try:
+    # Optional C-accelerated JSON codec (pip install ticktick-mcp[fast])
+    import orjson
+except ImportError:
+    orjson = None
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Display names for TickTick priority and status codes
+_PRIORITY_MAP = {0: "None", 1: "Low", 3: "Medium", 5: "High"}
+_STATUS_MAP = {0: "Active", 1: "Completed", 2: "Archived"}
+_VALID_PRIORITIES = frozenset(_PRIORITY_MAP)
+_VALID_VIEW_MODES = frozenset(("list", "kanban", "timeline"))
+
+# Display names for task fields checked after create/update, keyed by API field
+_TASK_FIELD_LABELS = {
+    'title': "Title",
+    'content': "Content",
+    'priority': "Priority",
+    'startDate': "Start date",
+    'dueDate': "Due date",
+    'repeatFlag': "Repeat flag",
+}
+
+# Box-drawing and rule lines shared by the formatters and listing tables
+_HEADER_TOP = "┏━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━┓\n"
+_HEADER_BOTTOM = "┗━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━┛\n\n"
+_SUBTASK_TOP = "┌────────────────────────────────────────────────────────────────────┐\n"
+_SUBTASK_SEP = "├────────────────────────────────────────────────────────────────────┤\n"
+_SUBTASK_BOTTOM = "└────────────────────────────────────────────────────────────────────┘\n"
+_TABLE_RULE = "--------------------------------------------------------\n"
+
+# Row templates for the list_all_tasks and find_old_tasks tables
+_ALL_TASKS_ROW = "| %-33s | %-24s | %-23s | %-10s |\n"
+_OLD_TASKS_ROW = "| %-33s | %-10s | %-23s | %s |\n"
+
+# Not-found replies shared by the task and project tools
+_ERR_TASK_NOT_FOUND = "❌ Error: Task not found (ID: {task_id}).\nThe task may have been {already}deleted or never existed.\n\nPlease verify the task ID is correct."
+_ERR_PROJECT_NOT_FOUND = "❌ Error: Project not found (ID: {project_id}).\nThe project may have been already deleted or never existed.\n\nPlease verify the project ID is correct."
+
+# Accepted project colors: #RGB or #RRGGBB
+_HEX_COLOR_RE = re.compile(r'^#(?:[0-9A-Fa-f]{3}|[0-9A-Fa-f]{6})$')
+
+# Accepted shape for start/due dates, e.g. 2024-05-07T10:00:00+0000
+_ISO_DT_RE = re.compile(r'^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(?:\.\d+)?(?:Z|[+-]\d{2}:?\d{2})$')
+
+# Re-fetch tasks after mutations to confirm the change landed (opt-in, costs an extra API call)
+_VERIFY_MUTATIONS = os.getenv("TICKTICK_MCP_VERIFY_MUTATIONS", "0").lower() in ("1", "true", "yes")
+
+# Task count above which list_all_tasks and get_project_tasks write their results to a JSON file and return a handle instead
+_LARGE_RESULT_TASKS = int(os.getenv("TICKTICK_MCP_LARGE_RESULT_TASKS", "500"))
+
+# Result handle files live in a per-process directory that is removed at shutdown;
+# only the newest _MAX_RESULT_FILES are kept while the server runs
+_MAX_RESULT_FILES = 20
+_result_dir: Optional[str] = None
+_result_files: deque = deque()
+
 # Create FastMCP server
 mcp = FastMCP("ticktick")
 
 # Create TickTick client
 ticktick = None
 
+# Set once the client has been created so warm tool calls skip the .env probe
+_client_ready = False
+_client_lock = asyncio.Lock()
+
+# Project deletions queued by delete_project(background=True), tracked by job ID in
+# submission order; only the newest _MAX_DELETE_JOBS finished jobs are remembered
+_MAX_DELETE_JOBS = 1000
+_delete_jobs: Dict[str, Dict[str, Any]] = {}
+_delete_queue: Optional[asyncio.Queue] = None
+_delete_worker_task: Optional[asyncio.Task] = None
+
+# In-flight client reads, keyed by method name and arguments, shared by concurrent callers
+_inflight: Dict[tuple, asyncio.Future] = {}
+
 def initialize_client():
-    global ticktick
+    global ticktick, _client_ready
     try:
         # Check if .env file exists with access token
-        from pathlib import Path
-        env_path = Path('.env')
-        if not env_path.exists():
+        env_path = '.env'
+        if not os.path.exists(env_path):
             logger.error("No .env file found. Please run 'uv run -m ticktick_mcp.cli auth' to set up authentication.")
             return False
         
         # Check if we have valid credentials
-        with open(env_path, 'r') as f:
-            content = f.read()
-            if 'TICKTICK_ACCESS_TOKEN' not in content:
-                logger.error("No access token found in .env file. Please run 'uv run -m ticktick_mcp.cli auth' to authenticate.")
-                return False
+        load_dotenv(env_path)
+        if not os.getenv('TICKTICK_ACCESS_TOKEN'):
+            logger.error("No access token found in .env file. Please run 'uv run -m ticktick_mcp.cli auth' to authenticate.")
+            return False
         
-        # Initialize the client
+        # Initialize the client; imported here so requests loads only when a client is created
+        from .ticktick_client import TickTickClient
         ticktick = TickTickClient()
         logger.info("TickTick client initialized successfully")
         
-        # Bypass API connectivity check for now
-        return True
-        # Original Test API connectivity
-        projects = ticktick.get_projects()
-        if 'error' in projects:
-            logger.error(f"Failed to access TickTick API: {projects['error']}")
-            logger.error("Your access token may have expired. Please run 'uv run -m ticktick_mcp.cli auth' to refresh it.")
-            return False
+        # Optional API connectivity check; skipped by default to keep startup free of API calls
+        if os.getenv('TICKTICK_MCP_HEALTHCHECK'):
+            projects = ticktick.get_projects()
+            if 'error' in projects:
+                logger.error("Failed to access TickTick API: %s", projects['error'])
+                logger.error("Your access token may have expired. Please run 'uv run -m ticktick_mcp.cli auth' to refresh it.")
+                return False
             
-        logger.info(f"Successfully connected to TickTick API with {len(projects)} projects")
+            logger.info("Successfully connected to TickTick API with %s projects", len(projects))
+        
+        _client_ready = True
         return True
     except Exception as e:
-        logger.error(f"Failed to initialize TickTick client: {e}")
+        logger.error("Failed to initialize TickTick client: %s", e)
+        return False
+
+async def _ensure_client() -> bool:
+    """Initialize the TickTick client once, serializing concurrent first calls."""
+    if _client_ready:
+        return True
+    async with _client_lock:
+        # Another tool call may have finished initialization while we waited
+        if _client_ready:
+            return True
+        return initialize_client()
+
+async def _coalesced(fn, *args):
+    """
+    Run a blocking client read off the event loop, sharing a single call
+    between concurrent requests for the same method and arguments.
+    """
+    key = (fn.__name__, *args)
+    future = _inflight.get(key)
+    if future is None:
+        future = asyncio.ensure_future(asyncio.to_thread(fn, *args))
+        _inflight[key] = future
+        future.add_done_callback(lambda _: _inflight.pop(key, None))
+    # Shield so one caller being cancelled does not cancel the shared call
+    return await asyncio.shield(future)
+
+def mcp_tool(error_message: str):
+    """
+    Register an async function as an MCP tool with the shared client guard and error handling.
+    
+    Args:
+        error_message: Message returned when the tool raises; "{error}" is replaced with the exception text
+    """
+    # Keep the failure message in the same style as the tool's other errors
+    init_error = "Failed to initialize TickTick client. Please check your API credentials."
+    if error_message.startswith("❌"):
+        init_error = "❌ " + init_error
+    
+    def decorator(fn):
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            if not _client_ready and not await _ensure_client():
+                return init_error
+            try:
+                return await fn(*args, **kwargs)
+            except Exception as e:
+                logger.error("Error in %s: %s", fn.__name__, e)
+                return error_message.format(error=e)
+        return mcp.tool()(wrapper)
+    return decorator
+
+async def _delete_worker():
+    """Drain queued project deletions, running up to the client's delete concurrency at once."""
+    while True:
+        batch = [await _delete_queue.get()]
+        while len(batch) < ticktick.delete_concurrency:
+            try:
+                batch.append(_delete_queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+        
+        for _, job_id in batch:
+            _delete_jobs[job_id]["status"] = "running"
+        results = await asyncio.gather(
+            *(asyncio.to_thread(ticktick.delete_project, project_id) for project_id, _ in batch),
+            return_exceptions=True,
+        )
+        
+        for (project_id, job_id), result in zip(batch, results):
+            job = _delete_jobs[job_id]
+            if isinstance(result, Exception):
+                job.update(status="failed", error=str(result))
+            elif 'error' in result:
+                job.update(status="failed", error=result['error'])
+            else:
+                job["status"] = "succeeded"
+            logger.info("Background deletion of project %s %s", project_id, job['status'])
+            _delete_queue.task_done()
+
+def _enqueue_project_delete(project_id: str) -> str:
+    """Queue a project deletion for the background worker and return its job ID."""
+    global _delete_queue, _delete_worker_task
+    # The worker must live on the server's event loop, so start it on first use
+    if _delete_queue is None:
+        _delete_queue = asyncio.Queue()
+        _delete_worker_task = asyncio.create_task(_delete_worker())
+    
+    job_id = uuid.uuid4().hex
+    _delete_jobs[job_id] = {"project_id": project_id, "status": "queued"}
+    _delete_queue.put_nowait((project_id, job_id))
+    
+    # Forget the oldest finished jobs; queued and running ones are still needed by the worker
+    excess = len(_delete_jobs) - _MAX_DELETE_JOBS
+    if excess > 0:
+        finished = [old_id for old_id, job in _delete_jobs.items() if job["status"] in ("succeeded", "failed")]
+        for old_id in finished[:excess]:
+            del _delete_jobs[old_id]
+    return job_id
+
+@functools.lru_cache(maxsize=8192)
+def _parse_iso(value: str) -> datetime:
+    """Parse a TickTick ISO timestamp, caching results since many tasks share timestamps."""
+    if value.endswith('Z'):
+        value = value[:-1] + '+00:00'
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        # Python 3.10's fromisoformat rejects TickTick's colon-less "+0000" offsets
+        return datetime.strptime(value, "%Y-%m-%dT%H:%M:%S.%f%z" if '.' in value else "%Y-%m-%dT%H:%M:%S%z")
+
+def _is_valid_iso(value: str) -> bool:
+    """Check a start/due date's shape with the regex, then that it names a real date and time."""
+    if not _ISO_DT_RE.match(value):
+        return False
+    try:
+        _parse_iso(value)
+    except ValueError:
         return False
+    return True
 
 # Format a task object from TickTick for better display
 def format_task(task: Dict) -> str:
     """Format a task into a human-readable string."""
-    task_id = task.get('id', 'Unknown')
+    get = task.get
+    task_id = get('id', 'Unknown')
     
     # Create a more visually distinct header for task ID
-    formatted = f"┏━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━┓\n"
-    formatted += f"┃ TASK ID: {task_id.ljust(66)} ┃\n"
-    formatted += f"┗━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━┛\n\n"
+    parts = [
+        _HEADER_TOP,
+        f"┃ TASK ID: {task_id:<66} ┃\n",
+        _HEADER_BOTTOM,
+    ]
     
     # Add task title with emphasized formatting
-    formatted += f"Title: {task.get('title', 'No title')}\n"
+    parts.append(f"Title: {get('title', 'No title')}\n")
     
     # Add project ID with improved visibility
-    project_id = task.get('projectId', 'None')
-    formatted += f"Project ID: {project_id}\n"
+    project_id = get('projectId', 'None')
+    parts.append(f"Project ID: {project_id}\n")
     
     # Add dates if available
-    if task.get('startDate'):
-        formatted += f"Start Date: {task.get('startDate')}\n"
-    if task.get('dueDate'):
-        formatted += f"Due Date: {task.get('dueDate')}\n"
+    if start_date := get('startDate'):
+        parts.append(f"Start Date: {start_date}\n")
+    if due_date := get('dueDate'):
+        parts.append(f"Due Date: {due_date}\n")
     
     # Calculate task age if we have creation or completion time
-    created_time = None
-    if task.get('createdTime'):
-        created_time = task.get('createdTime')
-        formatted += f"Created: {created_time}\n"
+    if created_time := get('createdTime'):
+        parts.append(f"Created: {created_time}\n")
     
     # Add priority if available
-    priority_map = {0: "None", 1: "Low", 3: "Medium", 5: "High"}
-    priority = task.get('priority', 0)
-    formatted += f"Priority: {priority_map.get(priority, str(priority))}\n"
+    priority = get('priority', 0)
+    parts.append(f"Priority: {_PRIORITY_MAP.get(priority, str(priority))}\n")
     
     # Add status if available with more details
-    status_map = {0: "Active", 1: "Completed", 2: "Archived"}
-    status = task.get('status', 0)
-    formatted += f"Status: {status_map.get(status, f'Unknown ({status})')}\n"
+    status = get('status', 0)
+    parts.append(f"Status: {_STATUS_MAP.get(status, f'Unknown ({status})')}\n")
     
     # Add completion time if available
-    if task.get('completedTime'):
-        formatted += f"Completed: {task.get('completedTime')}\n"
+    if completed_time := get('completedTime'):
+        parts.append(f"Completed: {completed_time}\n")
     
     # Add content if available
-    if task.get('content'):
-        formatted += f"\nContent:\n{task.get('content')}\n"
+    if content := get('content'):
+        parts.append(f"\nContent:\n{content}\n")
     
     # Add subtasks if available with improved ID visibility
-    items = task.get('items', [])
-    if items:
-        formatted += f"\nSubtasks ({len(items)}):\n"
-        formatted += f"┌────────────────────────────────────────────────────────────────────┐\n"
+    if items := get('items'):
+        parts.append(f"\nSubtasks ({len(items)}):\n")
+        rows = []
         for i, item in enumerate(items, 1):
             status = "✓" if item.get('status') == 1 else "□"
             item_id = item.get('id', 'Unknown')
             item_title = item.get('title', 'No title')
-            formatted += f"│ {i}. [{status}] {item_title[:40]}{' '*(40-min(40,len(item_title)))} │\n"
-            formatted += f"│    Subtask ID: {item_id.ljust(54)} │\n"
-            formatted += f"├────────────────────────────────────────────────────────────────────┤\n"
-        formatted = formatted[:-73]  # Remove the last separator
-        formatted += f"└────────────────────────────────────────────────────────────────────┘\n"
+            rows.append(f"│ {i}. [{status}] {item_title:<40.40} │\n│    Subtask ID: {item_id:<54} │\n")
+        parts.append(_SUBTASK_TOP)
+        parts.append(_SUBTASK_SEP.join(rows))
+        parts.append(_SUBTASK_BOTTOM)
     
     # Add reference information with key IDs for easy copying
-    formatted += f"\n📋 Reference Information (for use with other commands):\n"
-    formatted += f"Task ID: {task_id}\n"
-    formatted += f"Project ID: {project_id}\n"
+    parts.append("\n📋 Reference Information (for use with other commands):\n")
+    parts.append(f"Task ID: {task_id}\n")
+    parts.append(f"Project ID: {project_id}\n")
     
-    return formatted
+    return "".join(parts)
 
 # Format a project object from TickTick for better display
 def format_project(project: Dict) -> str:
     """Format a project into a human-readable string."""
-    project_id = project.get('id', 'Unknown')
+    get = project.get
+    project_id = get('id', 'Unknown')
     
     # Create a more visually distinct header for project ID
-    formatted = f"┏━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━┓\n"
-    formatted += f"┃ PROJECT ID: {project_id.ljust(64)} ┃\n"
-    formatted += f"┗━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━┛\n\n"
+    parts = [
+        _HEADER_TOP,
+        f"┃ PROJECT ID: {project_id:<64} ┃\n",
+        _HEADER_BOTTOM,
+    ]
     
     # Add project name with emphasized formatting
-    formatted += f"Name: {project.get('name', 'No name')}\n"
+    parts.append(f"Name: {get('name', 'No name')}\n")
     
     # Add color if available
-    if project.get('color'):
-        formatted += f"Color: {project.get('color')}\n"
+    if color := get('color'):
+        parts.append(f"Color: {color}\n")
     
     # Add view mode if available
-    if project.get('viewMode'):
-        formatted += f"View Mode: {project.get('viewMode')}\n"
+    if view_mode := get('viewMode'):
+        parts.append(f"View Mode: {view_mode}\n")
     
     # Add closed status if available
-    if 'closed' in project:
-        formatted += f"Closed: {'Yes' if project.get('closed') else 'No'}\n"
+    if (closed := get('closed')) is not None:
+        parts.append(f"Closed: {'Yes' if closed else 'No'}\n")
     
     # Add kind if available
-    if project.get('kind'):
-        formatted += f"Kind: {project.get('kind')}\n"
+    if kind := get('kind'):
+        parts.append(f"Kind: {kind}\n")
     
     # Add permission if available
-    if project.get('permission'):
-        formatted += f"Permission: {project.get('permission')}\n"
+    if permission := get('permission'):
+        parts.append(f"Permission: {permission}\n")
     
     # Add reference information with key IDs for easy copying
-    formatted += f"\n📋 Reference Information (for use with other commands):\n"
-    formatted += f"Project ID: {project_id}\n"
+    parts.append("\n📋 Reference Information (for use with other commands):\n")
+    parts.append(f"Project ID: {project_id}\n")
     
-    return formatted
+    return "".join(parts)
+
+def _ellipsize(text: str, width: int) -> str:
+    """Cut text to width characters, marking the cut with an ellipsis."""
+    return text if len(text) <= width else text[:width] + '...'
+
+def _field_mismatches(task: Dict, expected: Dict[str, Any]) -> List[tuple]:
+    """
+    Compare a task against the requested field values in one pass.
+    
+    Fields whose requested value is None are skipped. Returns a list of
+    (label, expected, actual) tuples for the fields that differ.
+    """
+    get = task.get
+    return [
+        (_TASK_FIELD_LABELS[field], value, actual)
+        for field, value in expected.items()
+        if value is not None and (actual := get(field)) != value
+    ]
+
+def _write_result_handle(tasks: List[Dict]) -> str:
+    """Write tasks to a temporary JSON file and return a handle pointing at it."""
+    global _result_dir
+    if _result_dir is None:
+        _result_dir = tempfile.mkdtemp(prefix='ticktick-mcp-')
+    if orjson is not None:
+        data = orjson.dumps(tasks, default=str, option=orjson.OPT_NON_STR_KEYS)
+    else:
+        data = json.dumps(tasks, default=str).encode('utf-8')
+    with tempfile.NamedTemporaryFile(
+        mode='wb', prefix='ticktick-tasks-', suffix='.json', dir=_result_dir, delete=False
+    ) as f:
+        f.write(data)
+    
+    _result_files.append(f.name)
+    while len(_result_files) > _MAX_RESULT_FILES:
+        try:
+            os.remove(_result_files.popleft())
+        except OSError:
+            pass
+    return json.dumps({"handle": f.name, "count": len(tasks)})
+
+async def _await_task_removal(project_id: str, task_id: str, max_wait: float = 4.0) -> tuple:
+    """
+    Poll a project's task listing with exponential backoff until a deleted task is gone.
+    
+    Each delay is drawn uniformly from zero up to the current backoff ("full jitter"),
+    so concurrent deletions do not poll the API in lockstep.
+    
+    Returns:
+        (removed, project_data) from the last poll; polling stops early on an error response
+    """
+    backoff = 0.2
+    waited = 0.0
+    while True:
+        delay = random.uniform(0, min(backoff, max_wait - waited))
+        await asyncio.sleep(delay)
+        waited += delay
+        # Bypass the TTL cache so each poll sees the backend's current listing
+        ticktick.invalidate_cache(project_id)
+        project_data = await asyncio.to_thread(ticktick.get_project_with_data, project_id)
+        if 'error' in project_data:
+            return False, project_data
+        if all(t.get('id') != task_id for t in project_data.get('tasks', [])):
+            return True, project_data
+        # Stop once the backoff reaches the remaining budget and the last poll has run
+        if backoff >= max_wait - waited:
+            return False, project_data
+        backoff *= 2
 
 # MCP Tools
 
-@mcp.tool()
+@mcp_tool("Error retrieving projects: {error}")
 async def get_projects() -> str:
     """Get all projects from TickTick."""
-    if not ticktick:
-        if not initialize_client():
-            return "Failed to initialize TickTick client. Please check your API credentials."
+    # Projects come back sorted by name for easier reference
+    sorted_projects = await asyncio.to_thread(ticktick.get_projects_sorted)
+    if 'error' in sorted_projects:
+        return f"Error fetching projects: {sorted_projects['error']}"
     
-    try:
-        projects = ticktick.get_projects()
-        if 'error' in projects:
-            return f"Error fetching projects: {projects['error']}"
-        
-        if not projects:
-            return "No projects found."
-        
-        # Sort projects by name for easier reference
-        sorted_projects = sorted(projects, key=lambda p: p.get('name', '').lower())
-        
-        result = f"Found {len(sorted_projects)} projects:\n\n"
-        result += "Quick reference (name and ID):\n"
-        for i, project in enumerate(sorted_projects, 1):
-            result += f"{i}. {project.get('name', 'Unnamed')} - ID: {project.get('id', 'Unknown')}\n"
-        
-        result += "\nDetailed project information:\n"
-        for i, project in enumerate(sorted_projects, 1):
-            result += f"\nProject {i}:\n" + format_project(project)
-        
-        return result
-    except Exception as e:
-        logger.error(f"Error in get_projects: {e}")
-        return f"Error retrieving projects: {str(e)}"
+    if not sorted_projects:
+        return "No projects found."
+    
+    parts = [f"Found {len(sorted_projects)} projects:\n\n"]
+    parts.append("Quick reference (name and ID):\n")
+    for i, project in enumerate(sorted_projects, 1):
+        parts.append(f"{i}. {project.get('name', 'Unnamed')} - ID: {project.get('id', 'Unknown')}\n")
+    
+    parts.append("\nDetailed project information:\n")
+    for i, project in enumerate(sorted_projects, 1):
+        parts.append(f"\nProject {i}:\n")
+        parts.append(format_project(project))
+    
+    return "".join(parts)
 
-@mcp.tool()
+@mcp_tool("Error retrieving project: {error}")
 async def get_project(project_id: str) -> str:
     """
     Get details about a specific project.
@@ -207,57 +459,53 @@ async def get_project(project_id: str) -> str:
     Args:
         project_id: ID of the project
     """
-    if not ticktick:
-        if not initialize_client():
-            return "Failed to initialize TickTick client. Please check your API credentials."
+    project = await _coalesced(ticktick.get_project, project_id)
+    if 'error' in project:
+        return f"Error fetching project: {project['error']}"
     
-    try:
-        project = ticktick.get_project(project_id)
-        if 'error' in project:
-            return f"Error fetching project: {project['error']}"
-        
-        return format_project(project)
-    except Exception as e:
-        logger.error(f"Error in get_project: {e}")
-        return f"Error retrieving project: {str(e)}"
+    return format_project(project)
 
-@mcp.tool()
-async def get_project_tasks(project_id: str) -> str:
+@mcp_tool("Error retrieving project tasks: {error}")
+async def get_project_tasks(project_id: str, summary_only: bool = False) -> str:
     """
     Get all tasks in a specific project.
     
     Args:
         project_id: ID of the project
+        summary_only: Return only the task count and quick reference list (default: False)
+    
+    Unless summary_only is set, results larger than TICKTICK_MCP_LARGE_RESULT_TASKS tasks
+    are written to a JSON file and returned as {"handle": path, "count": N}.
     """
-    if not ticktick:
-        if not initialize_client():
-            return "Failed to initialize TickTick client. Please check your API credentials."
+    project_data = await asyncio.to_thread(ticktick.get_project_with_data, project_id)
+    if 'error' in project_data:
+        return f"Error fetching project data: {project_data['error']}"
     
-    try:
-        project_data = ticktick.get_project_with_data(project_id)
-        if 'error' in project_data:
-            return f"Error fetching project data: {project_data['error']}"
-        
-        tasks = project_data.get('tasks', [])
-        if not tasks:
-            return f"No tasks found in project '{project_data.get('project', {}).get('name', project_id)}'."
-        
-        # Add task IDs to the response summary
-        result = f"Found {len(tasks)} tasks in project '{project_data.get('project', {}).get('name', project_id)}':\n\n"
-        result += "Quick reference (task titles and IDs):\n"
-        for i, task in enumerate(tasks, 1):
-            result += f"{i}. {task.get('title', 'Unnamed')} - ID: {task.get('id', 'Unknown')}\n"
-        
-        result += "\nDetailed task information:\n"
-        for i, task in enumerate(tasks, 1):
-            result += f"\nTask {i}:\n" + format_task(task)
-        
-        return result
-    except Exception as e:
-        logger.error(f"Error in get_project_tasks: {e}")
-        return f"Error retrieving project tasks: {str(e)}"
+    tasks = project_data.get('tasks', [])
+    if not tasks:
+        return f"No tasks found in project '{project_data.get('project', {}).get('name', project_id)}'."
+    
+    # Hand very large results back as a file reference rather than one huge response
+    if not summary_only and len(tasks) > _LARGE_RESULT_TASKS:
+        return _write_result_handle(tasks)
+    
+    # Add task IDs to the response summary
+    parts = [f"Found {len(tasks)} tasks in project '{project_data.get('project', {}).get('name', project_id)}':\n\n"]
+    parts.append("Quick reference (task titles and IDs):\n")
+    for i, task in enumerate(tasks, 1):
+        parts.append(f"{i}. {task.get('title', 'Unnamed')} - ID: {task.get('id', 'Unknown')}\n")
+    
+    if summary_only:
+        return "".join(parts)
+    
+    parts.append("\nDetailed task information:\n")
+    for i, task in enumerate(tasks, 1):
+        parts.append(f"\nTask {i}:\n")
+        parts.append(format_task(task))
+    
+    return "".join(parts)
 
-@mcp.tool()
+@mcp_tool("Error retrieving task: {error}")
 async def get_task(project_id: str, task_id: str) -> str:
     """
     Get details about a specific task.
@@ -266,95 +514,96 @@ async def get_task(project_id: str, task_id: str) -> str:
         project_id: ID of the project
         task_id: ID of the task
     """
-    if not ticktick:
-        if not initialize_client():
-            return "Failed to initialize TickTick client. Please check your API credentials."
+    task = await _coalesced(ticktick.get_task, project_id, task_id)
+    if 'error' in task:
+        return f"Error fetching task: {task['error']}"
     
-    try:
-        task = ticktick.get_task(project_id, task_id)
-        if 'error' in task:
-            return f"Error fetching task: {task['error']}"
-        
-        return format_task(task)
-    except Exception as e:
-        logger.error(f"Error in get_task: {e}")
-        return f"Error retrieving task: {str(e)}"
+    return format_task(task)
 
-@mcp.tool()
-async def list_all_tasks() -> str:
+@mcp_tool("Error retrieving all tasks: {error}")
+async def list_all_tasks(detailed: bool = False, summary_only: bool = False) -> str:
     """
     Fetch all tasks from all projects with their IDs for easy reference.
     This tool makes it easy to find tasks across all projects.
+    
+    Args:
+        detailed: Also include full details for every task (default: False, quick reference table only)
+        summary_only: Return only the task count and quick reference table, overriding detailed (default: False)
+    
+    Unless summary_only is set, results larger than TICKTICK_MCP_LARGE_RESULT_TASKS tasks
+    are written to a JSON file and returned as {"handle": path, "count": N}.
     """
-    if not ticktick:
-        if not initialize_client():
-            return "Failed to initialize TickTick client. Please check your API credentials."
+    # Get all projects first, sorted by name
+    sorted_projects = await asyncio.to_thread(ticktick.get_projects_sorted)
+    if 'error' in sorted_projects:
+        return f"Error fetching projects: {sorted_projects['error']}"
     
-    try:
-        # Get all projects first
-        projects = ticktick.get_projects()
-        if 'error' in projects:
-            return f"Error fetching projects: {projects['error']}"
-        
-        if not projects:
-            return "No projects found."
-        
-        # Sort projects by name
-        sorted_projects = sorted(projects, key=lambda p: p.get('name', '').lower())
-        
-        all_tasks = []
-        project_names = {}
-        
-        # Get tasks from each project
-        for project in sorted_projects:
-            project_id = project.get('id')
-            project_name = project.get('name', 'Unnamed Project')
-            project_names[project_id] = project_name
-            
-            logger.info(f"Fetching tasks from project '{project_name}' (ID: {project_id})")
-            project_data = ticktick.get_project_with_data(project_id)
-            
-            if 'error' in project_data:
-                logger.warning(f"Error fetching tasks from project '{project_name}': {project_data['error']}")
-                continue
-            
-            tasks = project_data.get('tasks', [])
-            for task in tasks:
-                # Add project name to the task for reference
-                task['project_name'] = project_name
-                all_tasks.append(task)
-        
-        if not all_tasks:
-            return "No tasks found in any projects."
-        
-        # Sort tasks by title for easier lookup
-        sorted_tasks = sorted(all_tasks, key=lambda t: t.get('title', '').lower())
-        
-        result = f"Found {len(sorted_tasks)} tasks across {len(sorted_projects)} projects:\n\n"
-        result += "Quick reference table (task titles and IDs):\n"
-        result += "--------------------------------------------------------\n"
-        result += "| Task Title | Task ID | Project | Status |\n"
-        result += "--------------------------------------------------------\n"
-        
-        for task in sorted_tasks:
-            title = task.get('title', 'Unnamed')[:30] + ('...' if len(task.get('title', '')) > 30 else '')
-            task_id = task.get('id', 'Unknown')
-            project_name = task.get('project_name', 'Unknown')[:20] + ('...' if len(task.get('project_name', '')) > 20 else '')
-            
-            status_map = {0: "Active", 1: "Completed", 2: "Archived"}
-            status = status_map.get(task.get('status', 0), "Unknown")
-            
-            result += f"| {title:<33} | {task_id:<24} | {project_name:<23} | {status:<10} |\n"
+    if not sorted_projects:
+        return "No projects found."
+    
+    all_tasks = []
+    project_names = {}
+    
+    # Get tasks from each project concurrently
+    logger.info("Fetching tasks from %s projects", len(sorted_projects))
+    projects_data = await asyncio.to_thread(ticktick.get_all_projects_with_data, sorted_projects)
+    
+    for project, project_data in projects_data:
+        project_id = project.get('id')
+        project_name = project.get('name', 'Unnamed Project')
+        project_names[project_id] = project_name
         
-        result += "--------------------------------------------------------\n"
-        result += "\nNote: To get detailed information about a specific task, use 'get_task' with the project ID and task ID."
+        if 'error' in project_data:
+            logger.warning("Error fetching tasks from project '%s': %s", project_name, project_data['error'])
+            continue
         
-        return result
-    except Exception as e:
-        logger.error(f"Error in list_all_tasks: {e}")
-        return f"Error retrieving all tasks: {str(e)}"
+        tasks = project_data.get('tasks', [])
+        for task in tasks:
+            # Add project name to the task for reference
+            task['project_name'] = project_name
+            all_tasks.append(task)
+    
+    if not all_tasks:
+        return "No tasks found in any projects."
+    
+    # Sort tasks by title for easier lookup
+    sorted_tasks = sorted(all_tasks, key=lambda t: t.get('title', '').lower())
+    
+    # Hand very large results back as a file reference rather than one huge response
+    if not summary_only and len(sorted_tasks) > _LARGE_RESULT_TASKS:
+        return _write_result_handle(sorted_tasks)
+    
+    parts = [f"Found {len(sorted_tasks)} tasks across {len(sorted_projects)} projects:\n\n"]
+    parts.append("Quick reference table (task titles and IDs):\n")
+    parts.append(_TABLE_RULE)
+    parts.append("| Task Title | Task ID | Project | Status |\n")
+    parts.append(_TABLE_RULE)
+    
+    for task in sorted_tasks:
+        get = task.get
+        title = _ellipsize(get('title', 'Unnamed'), 30)
+        task_id = get('id', 'Unknown')
+        project_name = _ellipsize(get('project_name', 'Unknown'), 20)
+        status = _STATUS_MAP.get(get('status', 0), "Unknown")
+        
+        parts.append(_ALL_TASKS_ROW % (title, task_id, project_name, status))
+    
+    parts.append(_TABLE_RULE)
+    
+    if summary_only:
+        return "".join(parts)
+    
+    if detailed:
+        parts.append("\nDetailed task information:\n")
+        for i, task in enumerate(sorted_tasks, 1):
+            parts.append(f"\nTask {i} (project: {task.get('project_name', 'Unknown')}):\n")
+            parts.append(format_task(task))
+    else:
+        parts.append("\nNote: To get detailed information about a specific task, use 'get_task' with the project ID and task ID.")
+    
+    return "".join(parts)
 
-@mcp.tool()
+@mcp_tool("Error finding old tasks: {error}")
 async def find_old_tasks(days: int = 30) -> str:
     """
     Find tasks that have not been updated in a specified number of days.
@@ -363,94 +612,89 @@ async def find_old_tasks(days: int = 30) -> str:
     Args:
         days: Number of days to consider a task as old (default: 30)
     """
-    if not ticktick:
-        if not initialize_client():
-            return "Failed to initialize TickTick client. Please check your API credentials."
-    
     if days <= 0:
         return "Days must be a positive number."
     
-    try:
-        # Get all projects first
-        projects = ticktick.get_projects()
-        if 'error' in projects:
-            return f"Error fetching projects: {projects['error']}"
-        
-        if not projects:
-            return "No projects found."
-        
-        # Calculate the cutoff date
-        now = datetime.now(timezone.utc)
-        cutoff_date = now - timedelta(days=days)
+    # Get all projects first
+    projects = await asyncio.to_thread(ticktick.get_projects)
+    if 'error' in projects:
+        return f"Error fetching projects: {projects['error']}"
+    
+    if not projects:
+        return "No projects found."
+    
+    # Calculate the cutoff date
+    now = datetime.now(timezone.utc)
+    cutoff_date = now - timedelta(days=days)
+    # UTC timestamps sort lexicographically, so recent tasks can be rejected without parsing
+    cutoff_iso = cutoff_date.strftime('%Y-%m-%dT%H:%M:%S')
+    # Remaining comparisons and the age column work on epoch seconds
+    now_ts = now.timestamp()
+    cutoff_ts = cutoff_date.timestamp()
+    
+    old_tasks = []
+    project_names = {}
+    
+    # Get tasks from each project concurrently
+    logger.info("Checking %s projects for old tasks", len(projects))
+    projects_data = await asyncio.to_thread(ticktick.get_all_projects_with_data, projects)
+    
+    for project, project_data in projects_data:
+        project_id = project.get('id')
+        project_name = project.get('name', 'Unnamed Project')
+        project_names[project_id] = project_name
         
-        old_tasks = []
-        project_names = {}
+        if 'error' in project_data:
+            logger.warning("Error fetching tasks from project '%s': %s", project_name, project_data['error'])
+            continue
         
-        # Get tasks from each project
-        for project in projects:
-            project_id = project.get('id')
-            project_name = project.get('name', 'Unnamed Project')
-            project_names[project_id] = project_name
-            
-            logger.info(f"Checking project '{project_name}' for old tasks")
-            project_data = ticktick.get_project_with_data(project_id)
-            
-            if 'error' in project_data:
-                logger.warning(f"Error fetching tasks from project '{project_name}': {project_data['error']}")
+        tasks = project_data.get('tasks', [])
+        for task in tasks:
+            # Check task age based on creation/modification time
+            # TickTick API might have different date fields, adjust as needed
+            timestamp = task.get('modifiedTime') or task.get('createdTime') or task.get('startDate')
+            if not timestamp:
                 continue
             
-            tasks = project_data.get('tasks', [])
-            for task in tasks:
-                # Check task age based on creation/modification time
-                # TickTick API might have different date fields, adjust as needed
-                task_date = None
-                
-                # Try to find a date to use for comparison
-                if task.get('modifiedTime'):
-                    task_date = datetime.fromisoformat(task.get('modifiedTime').replace('Z', '+00:00'))
-                elif task.get('createdTime'):
-                    task_date = datetime.fromisoformat(task.get('createdTime').replace('Z', '+00:00'))
-                elif task.get('startDate'):
-                    task_date = datetime.fromisoformat(task.get('startDate').replace('Z', '+00:00'))
-                
-                # Compare date if we found one
-                if task_date and task_date < cutoff_date:
-                    # Add project name to the task for reference
-                    task['project_name'] = project_name
-                    task['task_date'] = task_date
-                    old_tasks.append(task)
-        
-        if not old_tasks:
-            return f"No tasks found that are older than {days} days."
-        
-        # Sort tasks by age (oldest first)
-        sorted_tasks = sorted(old_tasks, key=lambda t: t.get('task_date', now))
-        
-        result = f"Found {len(sorted_tasks)} tasks older than {days} days:\n\n"
-        result += "Old Tasks (sorted by age, oldest first):\n"
-        result += "--------------------------------------------------------\n"
-        result += "| Task Title | Age (days) | Project | Task ID |\n"
-        result += "--------------------------------------------------------\n"
-        
-        for task in sorted_tasks:
-            title = task.get('title', 'Unnamed')[:30] + ('...' if len(task.get('title', '')) > 30 else '')
-            task_id = task.get('id', 'Unknown')
-            project_name = task.get('project_name', 'Unknown')[:20] + ('...' if len(task.get('project_name', '')) > 20 else '')
-            
-            # Calculate age in days
-            age_days = (now - task.get('task_date', now)).days
+            # Skip recent UTC tasks with a string comparison before parsing
+            if timestamp.endswith(('+0000', '+00:00', 'Z')) and timestamp[:19] >= cutoff_iso:
+                continue
             
-            result += f"| {title:<33} | {age_days:<10} | {project_name:<23} | {task_id} |\n"
+            # Compare the parsed date for the remaining tasks
+            task_ts = _parse_iso(timestamp).timestamp()
+            if task_ts < cutoff_ts:
+                # Keep the sort key and project name alongside the task rather than on it
+                old_tasks.append((task_ts, project_name, task))
+    
+    if not old_tasks:
+        return f"No tasks found that are older than {days} days."
+    
+    # Sort tasks by age (oldest first)
+    sorted_tasks = sorted(old_tasks, key=lambda entry: entry[0])
+    
+    parts = [f"Found {len(sorted_tasks)} tasks older than {days} days:\n\n"]
+    parts.append("Old Tasks (sorted by age, oldest first):\n")
+    parts.append(_TABLE_RULE)
+    parts.append("| Task Title | Age (days) | Project | Task ID |\n")
+    parts.append(_TABLE_RULE)
+    
+    for task_ts, project_name, task in sorted_tasks:
+        get = task.get
+        title = _ellipsize(get('title', 'Unnamed'), 30)
+        task_id = get('id', 'Unknown')
+        project_name = _ellipsize(project_name, 20)
         
-        result += "--------------------------------------------------------\n"
-        result += "\nTo delete or update any of these tasks, use 'delete_task' or 'update_task' with the appropriate project ID and task ID."
+        # Calculate age in days
+        age_days = int((now_ts - task_ts) // 86400)
         
-        return result
-    except Exception as e:
-        logger.error(f"Error in find_old_tasks: {e}")
-        return f"Error finding old tasks: {str(e)}"
+        parts.append(_OLD_TASKS_ROW % (title, age_days, project_name, task_id))
+    
+    parts.append(_TABLE_RULE)
+    parts.append("\nTo delete or update any of these tasks, use 'delete_task' or 'update_task' with the appropriate project ID and task ID.")
+    
+    return "".join(parts)
 
-@mcp.tool()
+@mcp_tool("❌ Error creating task: {error}\n\nPlease check your inputs and try again.")
 async def create_task(
     title: str, 
     project_id: str, 
@@ -459,7 +703,8 @@ async def create_task(
     due_date: str = None, 
     priority: int = 0,
     repeat_flag: str = None,
-    tags: list = None
+    tags: list = None,
+    verify: bool = False
 ) -> str:
     """
     Create a new task in TickTick with enhanced validation and verification.
@@ -473,11 +718,8 @@ async def create_task(
         priority: Priority level (0: None, 1: Low, 3: Medium, 5: High) (optional)
         repeat_flag: Recurrence rule in RRULE format (e.g., "RRULE:FREQ=DAILY;INTERVAL=1") (optional)
         tags: List of tags to add to the task (optional)
+        verify: Re-fetch the task afterwards instead of checking the create response (default: False)
     """
-    if not ticktick:
-        if not initialize_client():
-            return "❌ Failed to initialize TickTick client. Please check your API credentials."
-    
     # STEP 1: Input validation
     # Validate title
     if not title or not title.strip():
@@ -487,108 +729,86 @@ async def create_task(
         return f"❌ Task title is too long ({len(title)} characters). Maximum length is 255 characters."
     
     # Validate priority
-    if priority not in [0, 1, 3, 5]:
+    if priority not in _VALID_PRIORITIES:
         return "❌ Invalid priority. Must be 0 (None), 1 (Low), 3 (Medium), or 5 (High)."
     
-    try:
-        # STEP 2: Verify project exists
-        project = ticktick.get_project(project_id)
-        if 'error' in project:
-            return f"❌ Error: Project not found. {project['error']}\nPlease verify the project ID is correct."
-        
-        project_name = project.get('name', 'Unknown Project')
-        logger.info(f"Creating task '{title}' in project '{project_name}' (ID: {project_id})")
-        
-        # STEP 3: Validate dates
-        start_datetime = None
-        due_datetime = None
-        
-        for date_str, date_name in [(start_date, "start_date"), (due_date, "due_date")]:
-            if date_str:
-                try:
-                    # Try to parse the date to validate it
-                    parsed_date = datetime.fromisoformat(date_str.replace("Z", "+00:00"))
-                    if date_name == "start_date":
-                        start_datetime = parsed_date
-                    else:
-                        due_datetime = parsed_date
-                except ValueError:
-                    return f"❌ Invalid {date_name} format. Use ISO format: YYYY-MM-DDThh:mm:ss+0000"
-        
-        # Check if start date is after due date
-        if start_datetime and due_datetime and start_datetime > due_datetime:
-            return "❌ Invalid date range: Start date cannot be after due date."
-        
-        # STEP 4: Validate repeat_flag
-        if repeat_flag:
-            if not repeat_flag.startswith("RRULE:"):
-                return "❌ Invalid repeat_flag format. Must start with 'RRULE:'"
-            
-            # Basic validation of RRULE format
-            if "FREQ=" not in repeat_flag:
-                return "❌ Invalid repeat_flag: Missing FREQ parameter. Example: 'RRULE:FREQ=DAILY;INTERVAL=1'"
-        
-        # STEP 5: Create the task
-        task = ticktick.create_task(
-            title=title,
-            project_id=project_id,
-            content=content,
-            start_date=start_date,
-            due_date=due_date,
-            priority=priority,
-            repeat_flag=repeat_flag,
-            tags=tags
-        )
-        
-        if 'error' in task:
-            error_msg = task['error']
-            if "rate limit" in error_msg.lower():
-                return f"❌ Error creating task: API rate limit exceeded. Please try again later."
-            return f"❌ Error creating task: {error_msg}"
-        
-        task_id = task.get('id', '')
-        if not task_id:
-            return "⚠️ Task was created, but no task ID was returned. Unable to verify creation."
+    # STEP 2: Validate dates
+    for date_str, date_name in [(start_date, "start_date"), (due_date, "due_date")]:
+        if date_str and not _is_valid_iso(date_str):
+            return f"❌ Invalid {date_name} format. Use ISO format: YYYY-MM-DDThh:mm:ss+0000"
+    
+    # Check if start date is after due date (both already parsed above, so this hits the cache)
+    if start_date and due_date and _parse_iso(start_date) > _parse_iso(due_date):
+        return "❌ Invalid date range: Start date cannot be after due date."
+    
+    # STEP 3: Validate repeat_flag
+    if repeat_flag:
+        if not repeat_flag.startswith("RRULE:"):
+            return "❌ Invalid repeat_flag format. Must start with 'RRULE:'"
         
-        # STEP 6: Verify task was created by trying to fetch it
-        verification = ticktick.get_task(project_id, task_id)
+        # Basic validation of RRULE format
+        if "FREQ=" not in repeat_flag:
+            return "❌ Invalid repeat_flag: Missing FREQ parameter. Example: 'RRULE:FREQ=DAILY;INTERVAL=1'"
+    
+    # STEP 4: Create the task
+    logger.info("Creating task '%s' in project %s", title, project_id)
+    task = await asyncio.to_thread(
+        ticktick.create_task,
+        title=title,
+        project_id=project_id,
+        content=content,
+        start_date=start_date,
+        due_date=due_date,
+        priority=priority,
+        repeat_flag=repeat_flag,
+        tags=tags
+    )
+    
+    if 'error' in task:
+        error_msg = task['error']
+        if task.get('http_status') == 404:
+            return f"❌ Error: Project not found. {error_msg}\nPlease verify the project ID is correct."
+        if "rate limit" in error_msg.lower():
+            return f"❌ Error creating task: API rate limit exceeded. Please try again later."
+        return f"❌ Error creating task: {error_msg}"
+    
+    task_id = task.get('id', '')
+    if not task_id:
+        return "⚠️ Task was created, but no task ID was returned. Unable to verify creation."
+    
+    # STEP 5: Optionally verify task was created by trying to fetch it,
+    # otherwise check the task returned by the create call
+    verification = task
+    if verify or _VERIFY_MUTATIONS:
+        verification = await asyncio.to_thread(ticktick.get_task, project_id, task_id)
         if 'error' in verification:
-            logger.warning(f"Task creation reported as successful, but verification failed: {verification['error']}")
+            logger.warning("Task creation reported as successful, but verification failed: %s", verification['error'])
             return f"⚠️ Task creation reported as successful, but verification failed. The task may or may not have been created.\n\nReported task details:\n{format_task(task)}"
-        
-        # STEP 7: Verify task content matches what was requested
-        verification_issues = []
-        
-        if verification.get('title') != title:
-            verification_issues.append(f"Title mismatch: Expected '{title}', got '{verification.get('title')}'")
-        
-        if content and verification.get('content') != content:
-            verification_issues.append("Content does not match requested content")
-        
-        if priority != verification.get('priority'):
-            verification_issues.append(f"Priority mismatch: Expected {priority}, got {verification.get('priority')}")
-        
-        if start_date and verification.get('startDate') != start_date:
-            verification_issues.append(f"Start date mismatch: Expected {start_date}, got {verification.get('startDate')}")
-        
-        if due_date and verification.get('dueDate') != due_date:
-            verification_issues.append(f"Due date mismatch: Expected {due_date}, got {verification.get('dueDate')}")
-        
-        if repeat_flag and verification.get('repeatFlag') != repeat_flag:
-            verification_issues.append(f"Repeat flag mismatch: Expected {repeat_flag}, got {verification.get('repeatFlag')}")
-        
-        # STEP 8: Return results with appropriate warnings/success
-        if verification_issues:
-            issues_list = "\n".join([f"- {issue}" for issue in verification_issues])
-            return f"⚠️ Task created, but some fields may not have been set correctly:\n{issues_list}\n\nTask details:\n{format_task(verification)}"
-        
-        # Success!
-        return f"✅ Task created successfully in project '{project_name}':\n\n" + format_task(verification)
-    except Exception as e:
-        logger.error(f"Error in create_task: {e}")
-        return f"❌ Error creating task: {str(e)}\n\nPlease check your inputs and try again."
+    
+    # STEP 6: Verify task content matches what was requested
+    mismatches = _field_mismatches(verification, {
+        'title': title,
+        'content': content or None,
+        'priority': priority,
+        'startDate': start_date or None,
+        'dueDate': due_date or None,
+        'repeatFlag': repeat_flag or None,
+    })
+    
+    # STEP 7: Return results with appropriate warnings/success
+    task_details = format_task(verification)
+    if mismatches:
+        issues_list = "\n".join(
+            "- Content does not match requested content" if label == "Content"
+            else f"- {label} mismatch: Expected {value}, got {actual}"
+            for label, value, actual in mismatches
+        )
+        return f"⚠️ Task created, but some fields may not have been set correctly:\n{issues_list}\n\nTask details:\n{task_details}"
+    
+    # Success!
+    return f"✅ Task created successfully in project {project_id}:\n\n{task_details}"
 
-@mcp.tool()
+@mcp_tool("❌ Error updating task: {error}\n\nPlease verify all parameters are correct and try again.")
 async def update_task(
     task_id: str,
     project_id: str,
@@ -614,142 +834,123 @@ async def update_task(
         repeat_flag: Recurrence rule in RRULE format (e.g., "RRULE:FREQ=DAILY;INTERVAL=1") (optional)
         tags: List of tags to add to the task (optional)
     """
-    if not ticktick:
-        if not initialize_client():
-            return "Failed to initialize TickTick client. Please check your API credentials."
+    # STEP 1: Initial verification - check if task exists
+    # Fetch the current task once; it is reused for the change summary and the update itself
+    existing_task = await _coalesced(ticktick.get_task_for_update, project_id, task_id)
+    if 'error' in existing_task:
+        return f"❌ Failed to find task to update: {existing_task['error']}\nPlease verify both the task ID and project ID are correct."
     
-    # STEP 1: Initial verification - check if task and project exist
-    try:
-        # Verify project exists
-        project = ticktick.get_project(project_id)
-        if 'error' in project:
-            return f"❌ Failed to find project: {project['error']}\nPlease verify the project ID is correct."
-        
-        # Verify task exists
-        existing_task = ticktick.get_task(project_id, task_id)
-        if 'error' in existing_task:
-            return f"❌ Failed to find task to update: {existing_task['error']}\nPlease verify both the task ID and project ID are correct."
-        
-        logger.info(f"Updating task {task_id} in project {project_id}")
-        
-        # Show current task info
-        current_task_info = f"Current task before update:\n{format_task(existing_task)}\n"
-        
-        # STEP 2: Validate input parameters
-        # Validate priority if provided
-        if priority is not None and priority not in [0, 1, 3, 5]:
-            return "❌ Invalid priority. Must be 0 (None), 1 (Low), 3 (Medium), or 5 (High)."
-        
-        # Validate dates if provided
-        for date_str, date_name in [(start_date, "start_date"), (due_date, "due_date")]:
-            if date_str:
-                try:
-                    # Try to parse the date to validate it
-                    datetime.fromisoformat(date_str.replace("Z", "+00:00"))
-                except ValueError:
-                    return f"❌ Invalid {date_name} format. Use ISO format: YYYY-MM-DDThh:mm:ss+0000"
-            
-        # Validate repeat_flag if provided
-        if repeat_flag and not repeat_flag.startswith("RRULE:"):
-            return "❌ Invalid repeat_flag format. Must start with 'RRULE:'"
-        
-        # STEP 3: Prepare changes summary for clear user feedback
-        changes = []
-        if title is not None and title != existing_task.get('title'):
-            changes.append(f"Title: '{existing_task.get('title', '')}' → '{title}'")
-        if content is not None and content != existing_task.get('content'):
-            old_content = existing_task.get('content', '')
-            old_summary = old_content[:50] + '...' if len(old_content) > 50 else old_content
-            new_summary = content[:50] + '...' if len(content) > 50 else content
-            changes.append(f"Content: '{old_summary}' → '{new_summary}'")
-        if start_date is not None and start_date != existing_task.get('startDate'):
-            changes.append(f"Start date: '{existing_task.get('startDate', '')}' → '{start_date}'")
-        if due_date is not None and due_date != existing_task.get('dueDate'):
-            changes.append(f"Due date: '{existing_task.get('dueDate', '')}' → '{due_date}'")
-        if priority is not None and priority != existing_task.get('priority'):
-            priority_map = {0: "None", 1: "Low", 3: "Medium", 5: "High"}
-            old_priority = priority_map.get(existing_task.get('priority', 0), str(existing_task.get('priority', 0)))
-            new_priority = priority_map.get(priority, str(priority))
-            changes.append(f"Priority: '{old_priority}' → '{new_priority}'")
-        if repeat_flag is not None and repeat_flag != existing_task.get('repeatFlag'):
-            old_flag = existing_task.get('repeatFlag', 'None')
-            changes.append(f"Repeat flag: '{old_flag}' → '{repeat_flag}'")
-        if tags is not None:
-            # Extract existing tags from title (TickTick stores tags in title with '#' prefix)
-            existing_tags = []
-            title_to_check = existing_task.get('title', '')
-            if '#' in title_to_check:
-                # Simple extraction based on words starting with #
-                words = title_to_check.split()
-                for word in words:
-                    if word.startswith('#'):
-                        existing_tags.append(word)
-            
-            # Format new tags for display
-            formatted_new_tags = [f"#{tag.strip('#')}" for tag in tags]
-            existing_display = ", ".join(existing_tags) if existing_tags else "None"
-            new_display = ", ".join(formatted_new_tags) if formatted_new_tags else "None"
-            
-            if existing_display != new_display:
-                changes.append(f"Tags: '{existing_display}' → '{new_display}'")
-        
-        # If no changes requested, inform the user
-        if not changes:
-            return f"ℹ️ No changes were specified. The task remains unchanged.\n\n{format_task(existing_task)}"
-        
-        # STEP 4: Update the task
-        logger.info(f"Updating task with the following changes: {changes}")
-        task = ticktick.update_task(
-            task_id=task_id,
-            project_id=project_id,
-            title=title,
-            content=content,
-            start_date=start_date,
-            due_date=due_date,
-            priority=priority,
-            repeat_flag=repeat_flag,
-            tags=tags
-        )
-        
-        if 'error' in task:
-            return f"❌ Error updating task: {task['error']}"
-        
-        # STEP 5: Verify the update was successful
-        # Fetch the task again to verify changes
-        updated_task = ticktick.get_task(project_id, task_id)
+    logger.info("Updating task %s in project %s", task_id, project_id)
+    
+    # STEP 2: Validate input parameters
+    # Validate priority if provided
+    if priority is not None and priority not in _VALID_PRIORITIES:
+        return "❌ Invalid priority. Must be 0 (None), 1 (Low), 3 (Medium), or 5 (High)."
+    
+    # Validate dates if provided
+    for date_str, date_name in [(start_date, "start_date"), (due_date, "due_date")]:
+        if date_str and not _is_valid_iso(date_str):
+            return f"❌ Invalid {date_name} format. Use ISO format: YYYY-MM-DDThh:mm:ss+0000"
+        
+    # Validate repeat_flag if provided
+    if repeat_flag and not repeat_flag.startswith("RRULE:"):
+        return "❌ Invalid repeat_flag format. Must start with 'RRULE:'"
+    
+    # STEP 3: Prepare changes summary for clear user feedback
+    changes = []
+    if title is not None and title != existing_task.get('title'):
+        changes.append(f"Title: '{existing_task.get('title', '')}' → '{title}'")
+    if content is not None and content != existing_task.get('content'):
+        old_summary = _ellipsize(existing_task.get('content', ''), 50)
+        new_summary = _ellipsize(content, 50)
+        changes.append(f"Content: '{old_summary}' → '{new_summary}'")
+    if start_date is not None and start_date != existing_task.get('startDate'):
+        changes.append(f"Start date: '{existing_task.get('startDate', '')}' → '{start_date}'")
+    if due_date is not None and due_date != existing_task.get('dueDate'):
+        changes.append(f"Due date: '{existing_task.get('dueDate', '')}' → '{due_date}'")
+    if priority is not None and priority != existing_task.get('priority'):
+        old_priority = _PRIORITY_MAP.get(existing_task.get('priority', 0), str(existing_task.get('priority', 0)))
+        new_priority = _PRIORITY_MAP.get(priority, str(priority))
+        changes.append(f"Priority: '{old_priority}' → '{new_priority}'")
+    if repeat_flag is not None and repeat_flag != existing_task.get('repeatFlag'):
+        old_flag = existing_task.get('repeatFlag', 'None')
+        changes.append(f"Repeat flag: '{old_flag}' → '{repeat_flag}'")
+    if tags is not None:
+        # Extract existing tags from title (TickTick stores tags in title with '#' prefix)
+        existing_tags = []
+        title_to_check = existing_task.get('title', '')
+        if '#' in title_to_check:
+            # Simple extraction based on words starting with #
+            words = title_to_check.split()
+            for word in words:
+                if word.startswith('#'):
+                    existing_tags.append(word)
+        
+        # Format new tags for display
+        formatted_new_tags = [f"#{tag.strip('#')}" for tag in tags]
+        existing_display = ", ".join(existing_tags) if existing_tags else "None"
+        new_display = ", ".join(formatted_new_tags) if formatted_new_tags else "None"
+        
+        if existing_display != new_display:
+            changes.append(f"Tags: '{existing_display}' → '{new_display}'")
+    
+    # If no changes requested, inform the user
+    if not changes:
+        return f"ℹ️ No changes were specified. The task remains unchanged.\n\n{format_task(existing_task)}"
+    
+    # STEP 4: Update the task
+    logger.info("Updating task with the following changes: %s", changes)
+    task = await asyncio.to_thread(
+        ticktick.update_task,
+        task_id=task_id,
+        project_id=project_id,
+        title=title,
+        content=content,
+        start_date=start_date,
+        due_date=due_date,
+        priority=priority,
+        repeat_flag=repeat_flag,
+        tags=tags,
+        current_task=existing_task
+    )
+    
+    if 'error' in task:
+        return f"❌ Error updating task: {task['error']}"
+    
+    # STEP 5: Verify the update was successful
+    # Optionally fetch the task again, otherwise check the task returned by the update call
+    updated_task = task
+    if _VERIFY_MUTATIONS:
+        updated_task = await asyncio.to_thread(ticktick.get_task, project_id, task_id)
         if 'error' in updated_task:
             return f"⚠️ Task update reported as successful, but verification failed: {updated_task['error']}\nThe task may or may not have been updated correctly."
-        
-        # Verify each change was applied correctly
-        verification_issues = []
-        if title is not None and updated_task.get('title') != title:
-            verification_issues.append(f"Title was not updated correctly. Expected: '{title}', Got: '{updated_task.get('title')}'")
-        if start_date is not None and updated_task.get('startDate') != start_date:
-            verification_issues.append(f"Start date was not updated correctly. Expected: '{start_date}', Got: '{updated_task.get('startDate')}'")
-        if due_date is not None and updated_task.get('dueDate') != due_date:
-            verification_issues.append(f"Due date was not updated correctly. Expected: '{due_date}', Got: '{updated_task.get('dueDate')}'")
-        if priority is not None and updated_task.get('priority') != priority:
-            verification_issues.append(f"Priority was not updated correctly. Expected: {priority}, Got: {updated_task.get('priority')}")
-        if repeat_flag is not None and updated_task.get('repeatFlag') != repeat_flag:
-            verification_issues.append(f"Repeat flag was not updated correctly. Expected: '{repeat_flag}', Got: '{updated_task.get('repeatFlag')}'")
-        
-        # If there were verification issues, report them
-        if verification_issues:
-            verification_warning = "\n".join([f"- {issue}" for issue in verification_issues])
-            return f"⚠️ Task was updated, but some changes may not have been applied correctly:\n{verification_warning}\n\nCurrent task state:\n{format_task(updated_task)}"
-        
-        # STEP 6: Build successful response with changes summary
-        changes_summary = "\n".join([f"- {change}" for change in changes])
-        response = f"✅ Task updated successfully with the following changes:\n{changes_summary}\n\n"
-        response += format_task(updated_task)
-        
-        return response
-        
-    except Exception as e:
-        logger.error(f"Error in update_task: {e}")
-        return f"❌ Error updating task: {str(e)}\n\nPlease verify all parameters are correct and try again."
+    
+    # Verify each change was applied correctly
+    mismatches = _field_mismatches(updated_task, {
+        'title': title,
+        'startDate': start_date,
+        'dueDate': due_date,
+        'priority': priority,
+        'repeatFlag': repeat_flag,
+    })
+    
+    # If there were verification issues, report them
+    if mismatches:
+        verification_warning = "\n".join(
+            f"- {label} was not updated correctly. Expected: {value!r}, Got: {actual!r}"
+            for label, value, actual in mismatches
+        )
+        return f"⚠️ Task was updated, but some changes may not have been applied correctly:\n{verification_warning}\n\nCurrent task state:\n{format_task(updated_task)}"
+    
+    # STEP 6: Build successful response with changes summary
+    changes_summary = "\n".join(f"- {change}" for change in changes)
+    response = f"✅ Task updated successfully with the following changes:\n{changes_summary}\n\n"
+    response += format_task(updated_task)
+    
+    return response
+    
 
-@mcp.tool()
+@mcp_tool("❌ Unexpected error completing task: {error}\n\nPlease try again or contact support if the issue persists.")
 async def complete_task(project_id: str, task_id: str) -> str:
     """
     Mark a task as complete with enhanced verification.
@@ -758,82 +959,72 @@ async def complete_task(project_id: str, task_id: str) -> str:
         project_id: ID of the project
         task_id: ID of the task
     """
-    if not ticktick:
-        if not initialize_client():
-            return "❌ Failed to initialize TickTick client. Please check your API credentials."
+    # STEP 1: Verify task exists and check current status
+    task = await _coalesced(ticktick.find_task, project_id, task_id)
+    if 'error' in task:
+        if task.get('http_status') == 404:
+            return _ERR_TASK_NOT_FOUND.format(task_id=task_id, already="")
+        else:
+            return f"❌ Error finding task to complete: {task['error']}\n\nPlease verify both the project ID and task ID are correct."
     
-    try:
-        # STEP 1: Verify project exists
-        project = ticktick.get_project(project_id)
-        if 'error' in project:
-            return f"❌ Error: Project not found (ID: {project_id}).\n{project['error']}\n\nPlease verify the project ID is correct."
-        
-        project_name = project.get('name', 'Unknown Project')
-        
-        # STEP 2: Verify task exists and check current status
-        task = ticktick.get_task(project_id, task_id)
-        if 'error' in task:
-            if "404" in str(task.get('error', '')):
-                return f"❌ Error: Task not found (ID: {task_id}).\nThe task may have been deleted or never existed.\n\nPlease verify the task ID is correct."
-            else:
-                return f"❌ Error finding task to complete: {task['error']}\n\nPlease verify both the project ID and task ID are correct."
-        
-        task_title = task.get('title', 'Unknown Task')
-        
-        # STEP 3: Check if task is already completed
-        status_map = {0: "Active", 1: "Completed", 2: "Archived"}
-        current_status = task.get('status', 0)
-        
-        if current_status == 2:
-            return f"ℹ️ Task '{task_title}' is already marked as complete.\n\n{format_task(task)}"
-        
-        logger.info(f"Marking task '{task_title}' (ID: {task_id}) in project '{project_name}' (ID: {project_id}) as complete")
-        
-        # Store task info before completion for comparison
-        task_info = format_task(task)
-        
-        # STEP 4: Complete the task
-        result = ticktick.complete_task(project_id, task_id)
-        if 'error' in result:
-            error_msg = result['error']
-            if "rate limit" in error_msg.lower():
-                return f"❌ Error completing task: API rate limit exceeded. Please try again later."
-            return f"❌ Error completing task: {error_msg}"
-        
-        # STEP 5: Verify task was marked as complete
-        updated_task = ticktick.get_task(project_id, task_id)
-        if 'error' in updated_task:
-            logger.warning(f"Task completion verification failed: {updated_task['error']}")
-            return f"⚠️ Task marked as complete, but verification failed: {updated_task['error']}\n\nTask status might not have updated.\n\nTask before completion:\n{task_info}"
-        
-        # STEP 6: Verify status changed
-        new_status = updated_task.get('status', 0)
-        if new_status != 2:
-            logger.warning(f"Task completion reported as successful, but status is {new_status} (expected 2)")
-            return f"⚠️ Task completion reported as successful, but status did not change to completed.\nCurrent status: {status_map.get(new_status, str(new_status))}\n\nCurrent task details:\n{format_task(updated_task)}"
-        
-        # STEP 7: Verify completedTime was set
-        if not updated_task.get('completedTime'):
-            logger.warning("Task status changed but completedTime field is missing")
-            return f"⚠️ Task was marked as complete, but the completion time was not set properly.\n\nUpdated task details:\n{format_task(updated_task)}"
-        
-        # Generate a user-friendly completion message
-        completion_time = updated_task.get('completedTime', 'Unknown time')
+    task_title = task.get('title', 'Unknown Task')
+    
+    # STEP 2: Check if task is already completed
+    current_status = task.get('status', 0)
+    
+    if current_status == 2:
+        return f"ℹ️ Task '{task_title}' is already marked as complete.\n\n{format_task(task)}"
+    
+    logger.info("Marking task '%s' (ID: %s) in project %s as complete", task_title, task_id, project_id)
+    
+    # STEP 3: Complete the task
+    result = await asyncio.to_thread(ticktick.complete_task, project_id, task_id)
+    if 'error' in result:
+        # The lookup may have come from a cached listing; the API has the final say
+        if result.get('http_status') == 404:
+            return _ERR_TASK_NOT_FOUND.format(task_id=task_id, already="")
+        error_msg = result['error']
+        if "rate limit" in error_msg.lower():
+            return f"❌ Error completing task: API rate limit exceeded. Please try again later."
+        return f"❌ Error completing task: {error_msg}"
+    
+    if not _VERIFY_MUTATIONS:
+        # The completion endpoint returns no content, so trust its success status
+        return f"✅ Task '{task_title}' marked as complete successfully.\n\nTask details:\n{format_task(task)}"
+    
+    # STEP 4: Verify task was marked as complete
+    updated_task = await asyncio.to_thread(ticktick.get_task, project_id, task_id)
+    if 'error' in updated_task:
+        logger.warning("Task completion verification failed: %s", updated_task['error'])
+        return f"⚠️ Task marked as complete, but verification failed: {updated_task['error']}\n\nTask status might not have updated.\n\nTask before completion:\n{format_task(task)}"
+    
+    # STEP 5: Verify status changed
+    new_status = updated_task.get('status', 0)
+    if new_status != 2:
+        logger.warning("Task completion reported as successful, but status is %s (expected 2)", new_status)
+        return f"⚠️ Task completion reported as successful, but status did not change to completed.\nCurrent status: {_STATUS_MAP.get(new_status, str(new_status))}\n\nCurrent task details:\n{format_task(updated_task)}"
+    
+    # STEP 6: Verify completedTime was set
+    if not updated_task.get('completedTime'):
+        logger.warning("Task status changed but completedTime field is missing")
+        return f"⚠️ Task was marked as complete, but the completion time was not set properly.\n\nUpdated task details:\n{format_task(updated_task)}"
+    
+    # Generate a user-friendly completion message
+    completion_time = updated_task.get('completedTime', 'Unknown time')
+    formatted_time = completion_time
+    # Format the completion time in a user-friendly way when it looks like an ISO timestamp
+    if _ISO_DT_RE.match(completion_time):
         try:
-            # Try to format the completion time in a user-friendly way
-            dt = datetime.fromisoformat(completion_time.replace("Z", "+00:00"))
-            formatted_time = dt.strftime("%B %d, %Y at %I:%M %p")
-        except:
-            formatted_time = completion_time
-        
-        # STEP 8: Return success message with details
-        return f"✅ Task '{task_title}' marked as complete successfully at {formatted_time}.\n\nUpdated task details:\n{format_task(updated_task)}"
+            formatted_time = _parse_iso(completion_time).strftime("%B %d, %Y at %I:%M %p")
+        except ValueError:
+            # Well-formed but out-of-range values (e.g. month 13) keep the raw string
+            pass
+    
+    # STEP 7: Return success message with details
+    return f"✅ Task '{task_title}' marked as complete successfully at {formatted_time}.\n\nUpdated task details:\n{format_task(updated_task)}"
     
-    except Exception as e:
-        logger.error(f"Error in complete_task: {e}")
-        return f"❌ Unexpected error completing task: {str(e)}\n\nPlease try again or contact support if the issue persists."
 
-@mcp.tool()
+@mcp_tool("❌ Unexpected error deleting task: {error}\n\nPlease try again or contact support if the issue persists.")
 async def delete_task(project_id: str, task_id: str) -> str:
     """
     Delete a task with enhanced error handling and verification.
@@ -842,114 +1033,95 @@ async def delete_task(project_id: str, task_id: str) -> str:
         project_id: ID of the project containing the task
         task_id: ID of the task to delete
     """
-    if not ticktick:
-        if not initialize_client():
-            return "❌ Failed to initialize TickTick client. Please check your API credentials."
+    # STEP 1: Verify task exists and capture details for reference
+    task = await _coalesced(ticktick.find_task, project_id, task_id)
+    if 'error' in task:
+        if task.get('http_status') == 404:
+            return _ERR_TASK_NOT_FOUND.format(task_id=task_id, already="already ")
+        else:
+            return f"❌ Error finding task to delete: {task['error']}\n\nPlease verify both the project ID and task ID are correct."
     
-    try:
-        # STEP 1: Verify project exists
-        project = ticktick.get_project(project_id)
-        if 'error' in project:
-            return f"❌ Error: Project not found (ID: {project_id}).\n{project['error']}\n\nPlease verify the project ID is correct."
-        
-        project_name = project.get('name', 'Unknown Project')
-        
-        # STEP 2: Verify task exists and capture details for reference
-        task = ticktick.get_task(project_id, task_id)
-        if 'error' in task:
-            if "404" in str(task.get('error', '')):
-                return f"❌ Error: Task not found (ID: {task_id}).\nThe task may have been already deleted or never existed.\n\nPlease verify the task ID is correct."
-            else:
-                return f"❌ Error finding task to delete: {task['error']}\n\nPlease verify both the project ID and task ID are correct."
-        
-        # Format task details for display before deletion
-        task_info = format_task(task)
-        task_title = task.get('title', 'Unknown Task')
-        
-        # STEP 3: Confirmation message
-        confirmation = f"Preparing to delete task '{task_title}' from project '{project_name}'...\n\n"
-        
-        # STEP 4: Delete the task
-        logger.info(f"Deleting task '{task_title}' (ID: {task_id}) from project '{project_name}' (ID: {project_id})")
-        result = ticktick.delete_task(project_id, task_id)
-        
-        # STEP 5: Handle API errors
-        if 'error' in result:
-            return f"❌ Error deleting task: {result['error']}\n\nTask details (not deleted):\n{task_info}"
-        
-        # STEP 6: Verify deletion with robust error handling
-        if result.get('status') == 'success':
-            # Check if this is a sync delay scenario
-            if result.get('has_sync_delay'):
-                return f"✅ Task '{task_title}' deletion was processed successfully.\n\nℹ️ Note: {result.get('message')}\n\n📋 Deleted task details:\n{task_info}"
-            # Successful deletion with verification
-            return f"✅ Task deleted successfully!\n\n📋 Deleted task details:\n{task_info}"
-            
-        elif result.get('status') == 'warning':
-            # Task was likely deleted but verification had issues
-            return f"⚠️ Task deletion reported as successful, but verification encountered an issue:\n{result.get('message', 'Unknown warning')}\n\n📋 Task that was likely deleted:\n{task_info}"
+    # Format task details for display before deletion
+    task_info = format_task(task)
+    task_title = task.get('title', 'Unknown Task')
+    
+    # STEP 2: Delete the task
+    logger.info("Deleting task '%s' (ID: %s) from project %s", task_title, task_id, project_id)
+    result = await asyncio.to_thread(
+        ticktick.delete_task, project_id, task_id, task=task, verify=_VERIFY_MUTATIONS
+    )
+    
+    # STEP 3: Handle API errors
+    if 'error' in result:
+        # The lookup may have come from a cached listing; the API has the final say
+        if result.get('error_code') == 'TASK_NOT_FOUND':
+            return _ERR_TASK_NOT_FOUND.format(task_id=task_id, already="already ")
+        return f"❌ Error deleting task: {result['error']}\n\nTask details (not deleted):\n{task_info}"
+    
+    # STEP 4: Verify deletion with robust error handling
+    if result.get('status') == 'success':
+        # Check if this is a sync delay scenario
+        if result.get('has_sync_delay'):
+            return f"✅ Task '{task_title}' deletion was processed successfully.\n\nℹ️ Note: {result.get('message')}\n\n📋 Deleted task details:\n{task_info}"
+        # Successful deletion with verification
+        return f"✅ Task deleted successfully!\n\n📋 Deleted task details:\n{task_info}"
+        
+    elif result.get('status') == 'warning':
+        # Task was likely deleted but verification had issues
+        return f"⚠️ Task deletion reported as successful, but verification encountered an issue:\n{result.get('message', 'Unknown warning')}\n\n📋 Task that was likely deleted:\n{task_info}"
+        
+    elif result.get('status') == 'failed':
+        # Deletion failed with error code
+        error_code = result.get('error_code', 'UNKNOWN_ERROR')
+        error_message = result.get('error', 'Unknown error occurred')
+        warning_code = result.get('warning_code', '')
+        
+        # Provide specific guidance based on error code
+        if error_code == 'DELETION_VERIFICATION_FAILED' or warning_code == 'DELETION_SYNC_DELAY':
+            return f"✅ Task '{task_title}' deletion was processed successfully.\n\nℹ️ Note: The task data may still be accessible via direct API for some time due to TickTick's caching, but it has been removed from your project view.\n\n📋 Deleted task details:\n{task_info}"
             
-        elif result.get('status') == 'failed':
-            # Deletion failed with error code
-            error_code = result.get('error_code', 'UNKNOWN_ERROR')
-            error_message = result.get('error', 'Unknown error occurred')
-            warning_code = result.get('warning_code', '')
+        elif error_code == 'API_ERROR':
+            return f"❌ Error: TickTick API error occurred during deletion: {error_message}\n\nPlease try again later or verify manually in the TickTick application.\n\n📋 Task details (not deleted):\n{task_info}"
             
-            # Provide specific guidance based on error code
-            if error_code == 'DELETION_VERIFICATION_FAILED' or warning_code == 'DELETION_SYNC_DELAY':
-                return f"✅ Task '{task_title}' deletion was processed successfully.\n\nℹ️ Note: The task data may still be accessible via direct API for some time due to TickTick's caching, but it has been removed from your project view.\n\n📋 Deleted task details:\n{task_info}"
-                
-            elif error_code == 'API_ERROR':
-                return f"❌ Error: TickTick API error occurred during deletion: {error_message}\n\nPlease try again later or verify manually in the TickTick application.\n\n📋 Task details (not deleted):\n{task_info}"
-                
-            else:
-                return f"❌ Error: {error_message}\n\nError code: {error_code}\n\n📋 Task details (not deleted):\n{task_info}"
-        
         else:
-            # Verify deletion using project task list approach
-            # Initial success message
-            success_msg = f"✅ Task deletion of '{task_title}' successfully processed.\n\n"
+            return f"❌ Error: {error_message}\n\nError code: {error_code}\n\n📋 Task details (not deleted):\n{task_info}"
+    
+    else:
+        # Verify deletion using project task list approach
+        # Initial success message
+        success_msg = f"✅ Task deletion of '{task_title}' successfully processed.\n\n"
+        
+        # Check project task listing to verify the task no longer appears there
+        try:
+            # Poll the listing until the backend sync drops the task
+            removed, project_data = await _await_task_removal(project_id, task_id)
             
-            # Check project task listing to verify the task no longer appears there
-            try:
-                # Add a small delay to allow for backend sync
-                time.sleep(1.5)
-                
-                # Get the project tasks
-                project_data = ticktick.get_project_with_data(project_id)
-                
-                if 'error' in project_data:
-                    # Couldn't verify via project listing, but API deletion was successful
-                    logger.warning(f"Couldn't verify task deletion via project listing: {project_data['error']}")
-                    success_msg = f"✅ Task '{task_title}' deletion was processed successfully.\n\nℹ️ Note: We couldn't verify the task's removal from project view, but the deletion request was accepted by TickTick.\n\n📋 Deleted task details:\n{task_info}"
+            if 'error' in project_data:
+                # Couldn't verify via project listing, but API deletion was successful
+                logger.warning("Couldn't verify task deletion via project listing: %s", project_data['error'])
+                success_msg = f"✅ Task '{task_title}' deletion was processed successfully.\n\nℹ️ Note: We couldn't verify the task's removal from project view, but the deletion request was accepted by TickTick.\n\n📋 Deleted task details:\n{task_info}"
+            else:
+                if removed:
+                    # Task no longer appears in project listing - confirmed deletion
+                    success_msg = f"✅ Task '{task_title}' deleted and removed from your project view.\n\n📋 Deleted task details:\n{task_info}"
                 else:
-                    # Check if task still appears in the project listing
-                    tasks = project_data.get('tasks', [])
-                    task_ids = [t.get('id') for t in tasks]
-                    
-                    if task_id not in task_ids:
-                        # Task no longer appears in project listing - confirmed deletion
-                        success_msg = f"✅ Task '{task_title}' deleted and removed from your project view.\n\n📋 Deleted task details:\n{task_info}"
-                    else:
-                        # Task still appears in project listing - potential sync issue
-                        logger.info(f"Task {task_id} still appears in project listing after deletion - likely due to sync delay")
-                        success_msg = f"ℹ️ Task '{task_title}' deletion was processed successfully. However, it may still appear in the project for a short time due to TickTick's sync delay.\n\nPlease refresh the project view after a moment.\n\n📋 Task details:\n{task_info}"
-            except Exception as e:
-                # Verification had an error, but the deletion was still reported as successful
-                logger.warning(f"Task deletion verification encountered an error: {e}")
-                success_msg = f"✅ Task '{task_title}' deletion was processed successfully.\n\nℹ️ Note: We couldn't verify the task's removal from project view due to a technical issue, but the deletion request was accepted by TickTick.\n\n📋 Deleted task details:\n{task_info}"
-            
-            return success_msg
+                    # Task still appears in project listing - potential sync issue
+                    logger.info("Task %s still appears in project listing after deletion - likely due to sync delay", task_id)
+                    success_msg = f"ℹ️ Task '{task_title}' deletion was processed successfully. However, it may still appear in the project for a short time due to TickTick's sync delay.\n\nPlease refresh the project view after a moment.\n\n📋 Task details:\n{task_info}"
+        except Exception as e:
+            # Verification had an error, but the deletion was still reported as successful
+            logger.warning("Task deletion verification encountered an error: %s", e)
+            success_msg = f"✅ Task '{task_title}' deletion was processed successfully.\n\nℹ️ Note: We couldn't verify the task's removal from project view due to a technical issue, but the deletion request was accepted by TickTick.\n\n📋 Deleted task details:\n{task_info}"
+        
+        return success_msg
     
-    except Exception as e:
-        logger.error(f"Error in delete_task: {e}")
-        return f"❌ Unexpected error deleting task: {str(e)}\n\nPlease try again or contact support if the issue persists."
 
-@mcp.tool()
+@mcp_tool("❌ Error creating project: {error}\n\nPlease check your inputs and try again.")
 async def create_project(
     name: str,
     color: str = "#F18181",
-    view_mode: str = "list"
+    view_mode: str = "list",
+    force: bool = False
 ) -> str:
     """
     Create a new project in TickTick with enhanced validation and verification.
@@ -958,11 +1130,8 @@ async def create_project(
         name: Project name
         color: Color code (hex format) (optional)
         view_mode: View mode - one of list, kanban, or timeline (optional)
+        force: Skip the duplicate-name check, e.g. for bulk imports with known-unique names (default: False)
     """
-    if not ticktick:
-        if not initialize_client():
-            return "❌ Failed to initialize TickTick client. Please check your API credentials."
-    
     # STEP 1: Input validation
     # Validate name
     if not name or not name.strip():
@@ -972,73 +1141,68 @@ async def create_project(
         return f"❌ Project name is too long ({len(name)} characters). Maximum length is 100 characters."
     
     # Validate view_mode
-    if view_mode not in ["list", "kanban", "timeline"]:
+    if view_mode not in _VALID_VIEW_MODES:
         return f"❌ Invalid view_mode: '{view_mode}'. Must be one of: list, kanban, timeline."
     
     # Validate color format (hex code)
-    if not color.startswith('#') or not all(c in '0123456789ABCDEFabcdef' for c in color[1:]) or len(color) not in [4, 7]:
+    if not _HEX_COLOR_RE.match(color):
         return f"❌ Invalid color format: '{color}'. Must be a hex code like '#F18181' or '#F81'."
     
-    try:
-        # STEP 2: Check if project with same name already exists
-        existing_projects = ticktick.get_projects()
-        if not isinstance(existing_projects, list) and 'error' in existing_projects:
-            logger.warning(f"Could not check for existing projects: {existing_projects['error']}")
-        else:
-            for existing in existing_projects:
-                if existing.get('name') == name:
-                    return f"⚠️ A project with the name '{name}' already exists (ID: {existing.get('id')}).\nPlease use a different name or use the existing project."
-        
-        logger.info(f"Creating new project '{name}' with view_mode '{view_mode}' and color '{color}'")
-        
-        # STEP 3: Create the project
-        project = ticktick.create_project(
-            name=name,
-            color=color,
-            view_mode=view_mode
-        )
-        
-        # STEP 4: Handle creation errors
-        if 'error' in project:
-            error_msg = project['error']
-            if "rate limit" in error_msg.lower():
-                return f"❌ Error creating project: API rate limit exceeded. Please try again later."
-            return f"❌ Error creating project: {error_msg}"
-        
-        project_id = project.get('id', '')
-        if not project_id:
-            return "⚠️ Project was created, but no project ID was returned. Unable to verify creation."
-        
-        # STEP 5: Verify project was created by trying to fetch it
-        verification = ticktick.get_project(project_id)
-        if 'error' in verification:
-            logger.warning(f"Project creation reported as successful, but verification failed: {verification['error']}")
-            return f"⚠️ Project creation reported as successful, but verification failed. The project may or may not have been created.\n\nReported project details:\n{format_project(project)}"
-        
-        # STEP 6: Verify project properties match what was requested
-        verification_issues = []
-        
-        if verification.get('name') != name:
-            verification_issues.append(f"Name mismatch: Expected '{name}', got '{verification.get('name')}'")
-        
-        if verification.get('color') != color:
-            verification_issues.append(f"Color mismatch: Expected '{color}', got '{verification.get('color')}'")
-        
-        if verification.get('viewMode') != view_mode:
-            verification_issues.append(f"View mode mismatch: Expected '{view_mode}', got '{verification.get('viewMode')}'")
-        
-        # STEP 7: Return results with appropriate warnings/success
-        if verification_issues:
-            issues_list = "\n".join([f"- {issue}" for issue in verification_issues])
-            return f"⚠️ Project created, but some properties may not have been set correctly:\n{issues_list}\n\nProject details:\n{format_project(verification)}"
-        
-        # Success!
-        return f"✅ Project '{name}' created successfully with ID: {project_id}\n\n" + format_project(verification)
-    except Exception as e:
-        logger.error(f"Error in create_project: {e}")
-        return f"❌ Error creating project: {str(e)}\n\nPlease check your inputs and try again."
+    # STEP 2: Check if project with same name already exists
+    existing = None if force else await asyncio.to_thread(ticktick.find_project_by_name, name)
+    if existing is not None and 'error' in existing:
+        logger.warning("Could not check for existing projects: %s", existing['error'])
+    elif existing is not None:
+        return f"⚠️ A project with the name '{name}' already exists (ID: {existing.get('id')}).\nPlease use a different name or use the existing project."
+    
+    logger.info("Creating new project '%s' with view_mode '%s' and color '%s'", name, view_mode, color)
+    
+    # STEP 3: Create the project
+    project = await asyncio.to_thread(
+        ticktick.create_project,
+        name=name,
+        color=color,
+        view_mode=view_mode
+    )
+    
+    # STEP 4: Handle creation errors
+    if 'error' in project:
+        error_msg = project['error']
+        if "rate limit" in error_msg.lower():
+            return f"❌ Error creating project: API rate limit exceeded. Please try again later."
+        return f"❌ Error creating project: {error_msg}"
+    
+    project_id = project.get('id', '')
+    if not project_id:
+        return "⚠️ Project was created, but no project ID was returned. Unable to verify creation."
+    
+    # STEP 5: Verify project was created by trying to fetch it
+    verification = await asyncio.to_thread(ticktick.get_project, project_id)
+    if 'error' in verification:
+        logger.warning("Project creation reported as successful, but verification failed: %s", verification['error'])
+        return f"⚠️ Project creation reported as successful, but verification failed. The project may or may not have been created.\n\nReported project details:\n{format_project(project)}"
+    
+    # STEP 6: Verify project properties match what was requested
+    verification_issues = []
+    
+    if verification.get('name') != name:
+        verification_issues.append(f"Name mismatch: Expected '{name}', got '{verification.get('name')}'")
+    
+    if verification.get('color') != color:
+        verification_issues.append(f"Color mismatch: Expected '{color}', got '{verification.get('color')}'")
+    
+    if verification.get('viewMode') != view_mode:
+        verification_issues.append(f"View mode mismatch: Expected '{view_mode}', got '{verification.get('viewMode')}'")
+    
+    # STEP 7: Return results with appropriate warnings/success
+    if verification_issues:
+        issues_list = "\n".join(f"- {issue}" for issue in verification_issues)
+        return f"⚠️ Project created, but some properties may not have been set correctly:\n{issues_list}\n\nProject details:\n{format_project(verification)}"
+    
+    # Success!
+    return f"✅ Project '{name}' created successfully with ID: {project_id}\n\n" + format_project(verification)
 
-@mcp.tool()
+@mcp_tool("❌ Error updating tasks: {error}")
 async def update_tasks(tasks: list) -> str:
     """
     Update multiple tasks at once with batch processing.
@@ -1055,10 +1219,6 @@ async def update_tasks(tasks: list) -> str:
             - tags: New list of tags (optional)
             - repeat_flag: New recurrence rule (optional)
     """
-    if not ticktick:
-        if not initialize_client():
-            return "❌ Failed to initialize TickTick client. Please check your API credentials."
-    
     # Input validation
     if not tasks or not isinstance(tasks, list):
         return "❌ Invalid input: tasks must be a non-empty list of task dictionaries."
@@ -1067,8 +1227,8 @@ async def update_tasks(tasks: list) -> str:
         return "❌ Empty task list provided. Please provide at least one task to update."
     
     # Call batch update in the client
-    logger.info(f"Updating {len(tasks)} tasks in batch")
-    result = ticktick.update_tasks(tasks)
+    logger.info("Updating %s tasks in batch", len(tasks))
+    result = await asyncio.to_thread(ticktick.update_tasks, tasks)
     
     # Process results
     if 'error' in result:
@@ -1119,7 +1279,7 @@ async def update_tasks(tasks: list) -> str:
         # Unexpected status
         return f"⚠️ Unexpected result from batch update: {json.dumps(result)}"
 
-@mcp.tool()
+@mcp_tool("❌ Error completing tasks: {error}")
 async def complete_tasks(tasks: list) -> str:
     """
     Complete multiple tasks at once with batch processing.
@@ -1129,10 +1289,6 @@ async def complete_tasks(tasks: list) -> str:
             - id or task_id: Task ID (required)
             - project_id: Project ID (required)
     """
-    if not ticktick:
-        if not initialize_client():
-            return "❌ Failed to initialize TickTick client. Please check your API credentials."
-    
     # Input validation
     if not tasks or not isinstance(tasks, list):
         return "❌ Invalid input: tasks must be a non-empty list of task dictionaries."
@@ -1141,8 +1297,8 @@ async def complete_tasks(tasks: list) -> str:
         return "❌ Empty task list provided. Please provide at least one task to complete."
     
     # Call batch completion in the client
-    logger.info(f"Completing {len(tasks)} tasks in batch")
-    result = ticktick.complete_tasks(tasks)
+    logger.info("Completing %s tasks in batch", len(tasks))
+    result = await asyncio.to_thread(ticktick.complete_tasks, tasks)
     
     # Process results
     if 'error' in result:
@@ -1192,7 +1348,7 @@ async def complete_tasks(tasks: list) -> str:
         # Unexpected status
         return f"⚠️ Unexpected result from batch completion: {json.dumps(result)}"
 
-@mcp.tool()
+@mcp_tool("❌ Error deleting tasks: {error}")
 async def delete_tasks(tasks: list, confirm: bool = False) -> str:
     """
     Delete multiple tasks at once with batch processing.
@@ -1203,10 +1359,6 @@ async def delete_tasks(tasks: list, confirm: bool = False) -> str:
             - project_id: Project ID (required)
         confirm: Explicit confirmation required to delete tasks (must be True)
     """
-    if not ticktick:
-        if not initialize_client():
-            return "❌ Failed to initialize TickTick client. Please check your API credentials."
-    
     # SAFETY CHECK: Require explicit confirmation
     if not confirm:
         return "❌ CONFIRMATION REQUIRED: Batch deletion requires explicit confirmation. Set confirm=True to proceed.\n\n⚠️ WARNING: This operation will permanently delete multiple tasks and cannot be undone."
@@ -1219,8 +1371,8 @@ async def delete_tasks(tasks: list, confirm: bool = False) -> str:
         return "❌ Empty task list provided. Please provide at least one task to delete."
     
     # Call batch deletion in the client
-    logger.info(f"Deleting {len(tasks)} tasks in batch (with confirmation)")
-    result = ticktick.delete_tasks(tasks, confirm=True)
+    logger.info("Deleting %s tasks in batch (with confirmation)", len(tasks))
+    result = await asyncio.to_thread(ticktick.delete_tasks, tasks, confirm=True)
     
     # Process results
     if 'error' in result:
@@ -1269,8 +1421,8 @@ async def delete_tasks(tasks: list, confirm: bool = False) -> str:
         # Unexpected status
         return f"⚠️ Unexpected result from batch deletion: {json.dumps(result)}"
 
-@mcp.tool()
-async def create_tasks(tasks: list) -> str:
+@mcp_tool("❌ Error creating tasks: {error}")
+async def create_tasks(tasks: list, skip_duplicates: bool = False) -> str:
     """
     Create multiple tasks at once with batch processing.
     
@@ -1284,11 +1436,8 @@ async def create_tasks(tasks: list) -> str:
             - priority: Priority level (optional)
             - tags: List of tags (optional)
             - repeat_flag: Recurrence rule (optional)
+        skip_duplicates: Create only one of any identical tasks in the list (default: False)
     """
-    if not ticktick:
-        if not initialize_client():
-            return "❌ Failed to initialize TickTick client. Please check your API credentials."
-    
     # Input validation
     if not tasks or not isinstance(tasks, list):
         return "❌ Invalid input: tasks must be a non-empty list of task dictionaries."
@@ -1306,19 +1455,22 @@ async def create_tasks(tasks: list) -> str:
             return f"❌ Invalid task at position {i}: missing required field 'project_id'."
     
     # Create tasks in batch
-    logger.info(f"Creating {len(tasks)} tasks in batch")
-    result = ticktick.create_tasks(tasks)
+    logger.info("Creating %s tasks in batch", len(tasks))
+    result = await asyncio.to_thread(ticktick.create_tasks, tasks, skip_duplicates)
     
     # Handle different result scenarios
     if 'error' in result:
         return f"❌ Error creating tasks: {result['error']}"
     
+    skipped = result.get('skipped_duplicates', [])
+    skipped_text = f" out of {len(tasks)} submitted ({len(skipped)} duplicates skipped)" if skipped else ""
+    
     if result.get('status') == 'success':
         created_tasks = result.get('tasks', [])
         
         # If batch API returned created tasks directly
         if isinstance(created_tasks, list) and all(isinstance(t, dict) for t in created_tasks):
-            success_msg = f"✅ Successfully created {len(created_tasks)} tasks:\n\n"
+            success_msg = f"✅ Successfully created {len(created_tasks)} tasks{skipped_text}:\n\n"
             
             # Format a brief summary of created tasks
             for i, task in enumerate(created_tasks, 1):
@@ -1336,7 +1488,10 @@ async def create_tasks(tasks: list) -> str:
         success_count = result.get('successful_count', 0)
         total_count = result.get('total_count', len(tasks))
         
-        partial_msg = f"⚠️ Partially successful: Created {success_count} out of {total_count} tasks.\n\n"
+        partial_msg = f"⚠️ Partially successful: Created {success_count} out of {total_count} tasks"
+        if skipped:
+            partial_msg += f" ({len(skipped)} duplicates skipped)"
+        partial_msg += ".\n\n"
         
         # Add details about successful and failed tasks
         successful_tasks = []
@@ -1372,88 +1527,214 @@ async def create_tasks(tasks: list) -> str:
     # Generic error case
     return f"⚠️ Unexpected result from batch task creation: {json.dumps(result)}"
 
-@mcp.tool()
-async def delete_project(project_id: str) -> str:
+@mcp_tool("❌ Unexpected error deleting project: {error}\n\nPlease try again or contact support if the issue persists.")
+async def delete_project(project_id: str, verify: bool = False, quiet: bool = False, background: bool = False) -> str:
     """
     Delete a project with enhanced verification and error handling.
     
     Args:
         project_id: ID of the project to delete
+        verify: Re-fetch the project afterwards to confirm it is gone (default: False)
+        quiet: Skip fetching the project and its tasks before deleting; the reply then omits
+            the project details and task warning (default: False)
+        background: Queue the deletion and return a job ID immediately; check the outcome
+            with get_delete_status (default: False)
     """
-    if not ticktick:
-        if not initialize_client():
-            return "❌ Failed to initialize TickTick client. Please check your API credentials."
+    if background:
+        job_id = _enqueue_project_delete(project_id)
+        return json.dumps({"job_id": job_id, "status": "queued"})
     
-    try:
-        # STEP 1: Verify project exists
-        project = ticktick.get_project(project_id)
-        if 'error' in project:
-            if "404" in str(project.get('error', '')):
-                return f"❌ Error: Project not found (ID: {project_id}).\nThe project may have been already deleted or never existed.\n\nPlease verify the project ID is correct."
-            else:
-                return f"❌ Error finding project to delete: {project['error']}\n\nPlease verify the project ID is correct."
-        
-        project_name = project.get('name', 'Unknown Project')
-        
-        # STEP 2: Check for tasks in the project to warn user
-        project_data = ticktick.get_project_with_data(project_id)
-        tasks = []
-        
-        if 'error' in project_data:
-            logger.warning(f"Could not get tasks for project {project_id}: {project_data['error']}")
-        else:
-            tasks = project_data.get('tasks', [])
-        
-        # Format project info for display before deletion
-        project_info = format_project(project)
-        task_count = len(tasks)
-        
-        # STEP 3: Generate appropriate warnings
-        if task_count > 0:
-            # Generate a list of tasks that will be deleted
-            task_list = "\n".join([f"  - {i+1}. {task.get('title', 'Unnamed task')} (ID: {task.get('id', 'Unknown')})" 
-                                  for i, task in enumerate(tasks[:5])])
-            
-            # If there are more than 5 tasks, add a note
-            if task_count > 5:
-                task_list += f"\n  - ... and {task_count - 5} more tasks"
-            
-            warning = (f"⚠️ WARNING: This project contains {task_count} tasks that will also be deleted!\n\n"
-                      f"Tasks that will be deleted:\n{task_list}\n\n"
-                      f"Are you sure you want to proceed? This action cannot be undone.\n")
+    if quiet:
+        # Go straight to the DELETE; its status is authoritative
+        result = await asyncio.to_thread(ticktick.delete_project, project_id)
+        if 'error' in result:
+            if result.get('http_status') == 404:
+                return _ERR_PROJECT_NOT_FOUND.format(project_id=project_id)
+            return f"❌ Error deleting project: {result['error']}"
+        return f"✅ Project {project_id} deleted successfully."
+    
+    # STEP 1: Verify project exists, fetching its tasks for the warning at the same time
+    project, project_data = await asyncio.gather(
+        _coalesced(ticktick.get_project, project_id),
+        asyncio.to_thread(ticktick.get_project_with_data, project_id),
+    )
+    if 'error' in project:
+        if project.get('http_status') == 404:
+            return _ERR_PROJECT_NOT_FOUND.format(project_id=project_id)
         else:
-            warning = ""
-        
-        logger.info(f"Deleting project '{project_name}' (ID: {project_id}) with {task_count} tasks")
+            return f"❌ Error finding project to delete: {project['error']}\n\nPlease verify the project ID is correct."
+    
+    project_name = project.get('name', 'Unknown Project')
+    
+    # STEP 2: Check for tasks in the project to warn user
+    tasks = []
+    if 'error' in project_data:
+        logger.warning("Could not get tasks for project %s: %s", project_id, project_data['error'])
+    else:
+        tasks = project_data.get('tasks', [])
+    task_count = len(tasks)
+    
+    # Format project info for display before deletion
+    project_info = format_project(project)
+    
+    # STEP 3: Generate appropriate warnings
+    if task_count > 0:
+        # Generate a list of tasks that will be deleted
+        listed = tasks[:5]
+        task_list = "\n".join(f"  - {i}. {task.get('title', 'Unnamed task')} (ID: {task.get('id', 'Unknown')})"
+                              for i, task in enumerate(listed, 1))
         
-        # STEP 4: Delete the project
-        result = ticktick.delete_project(project_id)
-        if 'error' in result:
-            error_msg = result['error']
-            if "rate limit" in error_msg.lower():
-                return f"❌ Error deleting project: API rate limit exceeded. Please try again later."
-            return f"❌ Error deleting project: {error_msg}"
+        # If there are more tasks than listed, add a note
+        if task_count > len(listed):
+            task_list += f"\n  - ... and {task_count - len(listed)} more tasks"
         
-        # STEP 5: Verify deletion by checking if project still exists
-        verification = ticktick.get_project(project_id)
-        if 'error' in verification and "404" in str(verification.get('error', '')):
-            # Project not found, deletion was successful
-            success_msg = f"✅ Project '{project_name}' deleted successfully."
-            if task_count > 0:
-                success_msg += f" {task_count} tasks were also deleted."
-            
-            # Add detailed info
-            success_msg += f"\n\nDeleted project details:\n{project_info}"
-            return success_msg
-        elif 'error' in verification:
-            # Some other error occurred during verification
-            return f"⚠️ Project deletion reported as successful, but verification failed: {verification['error']}\n\nThe project may or may not have been deleted. Please check manually.\n\nProject details:\n{project_info}"
+        warning = (f"⚠️ WARNING: This project contains {task_count} tasks that will also be deleted!\n\n"
+                  f"Tasks that will be deleted:\n{task_list}\n\n"
+                  f"Are you sure you want to proceed? This action cannot be undone.\n")
+    else:
+        warning = ""
+    
+    logger.info("Deleting project '%s' (ID: %s) with %s tasks", project_name, project_id, task_count)
+    
+    # STEP 4: Delete the project
+    result = await asyncio.to_thread(ticktick.delete_project, project_id)
+    if 'error' in result:
+        error_msg = result['error']
+        if "rate limit" in error_msg.lower():
+            return f"❌ Error deleting project: API rate limit exceeded. Please try again later."
+        return f"❌ Error deleting project: {error_msg}"
+    
+    # Every outcome below ends with the same project details
+    details = f"\n\nProject details:\n{project_info}"
+    success_parts = [f"✅ Project '{project_name}' deleted successfully."]
+    if task_count > 0:
+        success_parts.append(f" {task_count} tasks were also deleted.")
+    success_parts.append(f"\n\nDeleted project details:\n{project_info}")
+    
+    if not (verify or _VERIFY_MUTATIONS):
+        # The DELETE status is authoritative, so skip the follow-up GET
+        return "".join(success_parts)
+    
+    # STEP 5: Verify deletion by checking if project still exists
+    verification = await asyncio.to_thread(ticktick.get_project, project_id)
+    if verification.get('http_status') == 404:
+        # Project not found, deletion was successful
+        return "".join(success_parts)
+    if 'error' in verification:
+        # Some other error occurred during verification
+        return f"⚠️ Project deletion reported as successful, but verification failed: {verification['error']}\n\nThe project may or may not have been deleted. Please check manually.{details}"
+    # Project still exists - deletion failed
+    return f"❌ Error: Project deletion reported as successful, but project still exists.\n\nThis may indicate a synchronization issue with the TickTick API.\nPlease try again or verify manually in the TickTick application.{details}"
+
+@mcp_tool("Error retrieving deletion status: {error}")
+async def get_delete_status(job_id: str) -> str:
+    """
+    Get the status of a project deletion queued with delete_project(background=True).
+    
+    Args:
+        job_id: Job ID returned by delete_project
+    """
+    job = _delete_jobs.get(job_id)
+    if job is None:
+        return f"No deletion job found with ID {job_id}."
+    
+    return json.dumps({"job_id": job_id, **job})
+
+@mcp_tool("❌ Error deleting projects: {error}")
+async def delete_projects(project_ids: list, confirm: bool = False) -> str:
+    """
+    Delete multiple projects at once, including all of their tasks.
+    
+    Args:
+        project_ids: List of project IDs to delete
+        confirm: Explicit confirmation required to delete projects (must be True)
+    """
+    # SAFETY CHECK: Require explicit confirmation
+    if not confirm:
+        return "❌ CONFIRMATION REQUIRED: Batch project deletion requires explicit confirmation. Set confirm=True to proceed.\n\n⚠️ WARNING: This operation will permanently delete the projects and all of their tasks and cannot be undone."
+    
+    # Input validation
+    if not project_ids or not isinstance(project_ids, list):
+        return "❌ Invalid input: project_ids must be a non-empty list of project IDs."
+    
+    logger.info("Deleting %s projects in batch (with confirmation)", len(project_ids))
+    result = await asyncio.to_thread(ticktick.delete_projects, project_ids)
+    if 'error' in result:
+        return f"❌ Error deleting projects: {result['error']}"
+    
+    succeeded = result['succeeded']
+    failed = result['failed']
+    
+    if not failed:
+        parts = [f"✅ Successfully deleted all {len(succeeded)} projects.\n\nDeleted projects:\n"]
+    elif succeeded:
+        parts = [f"⚠️ Partially successful: Deleted {len(succeeded)} out of {len(project_ids)} projects.\n\n✅ Successfully deleted:\n"]
+    else:
+        parts = [f"❌ Failed to delete all {len(failed)} projects.\n"]
+    
+    for i, project in enumerate(succeeded, 1):
+        parts.append(f"{i}. '{project['name']}' (ID: {project['id']})\n")
+    
+    if failed:
+        parts.append(f"\n❌ Failed deletions ({len(failed)}):\n")
+        for i, failure in enumerate(failed, 1):
+            parts.append(f"{i}. Project ID: {failure['id']} - Error: {failure['error']}\n")
+    
+    return "".join(parts)
+
+@mcp_tool("❌ Error executing batch: {error}")
+async def batch_execute(operations: list) -> str:
+    """
+    Run several TickTick tools in a single call.
+    
+    Operations run in order, so later operations can depend on earlier ones
+    (e.g. update a task, then complete it). A failing operation does not stop
+    the remaining ones.
+    
+    Args:
+        operations: List of operation dictionaries, each containing:
+            - tool: Name of the tool to run, e.g. "get_task" (required)
+            - args: Dictionary of arguments for the tool (optional)
+    """
+    # Input validation
+    if not operations or not isinstance(operations, list):
+        return "❌ Invalid input: operations must be a non-empty list of operation dictionaries."
+    
+    for i, operation in enumerate(operations):
+        if not isinstance(operation, dict):
+            return f"❌ Invalid operation at position {i}: must be a dictionary."
+        if operation.get('tool') not in _BATCH_TOOLS:
+            return f"❌ Invalid operation at position {i}: unknown tool '{operation.get('tool')}'. Available tools: {', '.join(sorted(_BATCH_TOOLS))}."
+        if not isinstance(operation.get('args', {}), dict):
+            return f"❌ Invalid operation at position {i}: 'args' must be a dictionary."
+    
+    logger.info("Executing %s operations in batch", len(operations))
+    parts = [f"Executed {len(operations)} operations:\n"]
+    for i, operation in enumerate(operations, 1):
+        tool_name = operation['tool']
+        tool = _BATCH_TOOLS[tool_name]
+        args = operation.get('args', {})
+        try:
+            # Check the arguments against the tool's signature before running it
+            inspect.signature(tool).bind(**args)
+        except TypeError as e:
+            result = f"❌ Invalid arguments for {tool_name}: {str(e)}"
         else:
-            # Project still exists - deletion failed
-            return f"❌ Error: Project deletion reported as successful, but project still exists.\n\nThis may indicate a synchronization issue with the TickTick API.\nPlease try again or verify manually in the TickTick application.\n\nProject details:\n{project_info}"
-    except Exception as e:
-        logger.error(f"Error in delete_project: {e}")
-        return f"❌ Unexpected error deleting project: {str(e)}\n\nPlease try again or contact support if the issue persists."
+            result = await tool(**args)
+        parts.append(f"\n━━ Operation {i}: {tool_name} ━━\n")
+        parts.append(f"{result}\n")
+    
+    return "".join(parts)
+
+# Tools that can be bundled through batch_execute
+_BATCH_TOOLS = {
+    tool.__name__: tool
+    for tool in (
+        get_projects, get_project, get_project_tasks, get_task, list_all_tasks, find_old_tasks,
+        create_task, update_task, complete_task, delete_task, create_project, delete_project,
+        create_tasks, update_tasks, complete_tasks, delete_tasks, delete_projects, get_delete_status,
+    )
+}
 
 def main():
     """Main entry point for the MCP server."""
@@ -1462,8 +1743,23 @@ def main():
         logger.error("Failed to initialize TickTick client. Please check your API credentials.")
         return
     
+    # Optional Prometheus endpoint for request latency, retry and batch fallback metrics
+    metrics_port = os.getenv("TICKTICK_METRICS_PORT")
+    if metrics_port:
+        try:
+            from prometheus_client import start_http_server
+            start_http_server(int(metrics_port))
+            logger.info("Serving metrics on port %s", metrics_port)
+        except ImportError:
+            logger.warning("TICKTICK_METRICS_PORT is set but prometheus_client is not installed; run 'uv pip install -e \".[metrics]\"'")
+    
     # Run the server
-    mcp.run(transport='stdio')
+    try:
+        mcp.run(transport='stdio')
+    finally:
+        ticktick.close()
+        if _result_dir is not None:
+            shutil.rmtree(_result_dir, ignore_errors=True)
 
 if __name__ == "__main__":
     main()
@@ -1,24 +1,260 @@
 import os
 import json
 import base64
+import copy
+import random
+import re
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import logging
+import math
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from dotenv import load_dotenv
 from typing import Dict, List, Any, Optional, Tuple
 
+try:
+    # Optional C-accelerated JSON codec (pip install ticktick-mcp[fast])
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    _json_loads = json.loads
+    
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
 # Set up logging
 logger = logging.getLogger(__name__)
 
+try:
+    # Optional Prometheus metrics (pip install ticktick-mcp[metrics]), served when TICKTICK_METRICS_PORT is set
+    from prometheus_client import Counter, Histogram
+except ImportError:
+    Counter = Histogram = None
+
+if Histogram is not None and os.getenv("TICKTICK_METRICS_PORT"):
+    _REQUEST_SECONDS = Histogram("ticktick_request_seconds", "TickTick API request latency",
+                                 ["method", "endpoint", "status"])
+    _RETRIES = Counter("ticktick_retries_total", "Requests retried after a recoverable error", ["operation"])
+    _BATCH_FALLBACKS = Counter("ticktick_batch_fallback_total", "Batch calls that fell back to per-item requests")
+else:
+    _REQUEST_SECONDS = _RETRIES = _BATCH_FALLBACKS = None
+
+# Path segments holding an ID, collapsed so metric labels stay low-cardinality
+_ID_SEGMENT_RE = re.compile(r"/[^/]*\d[^/]*")
+
+# Error messages worth retrying: timeouts, rate limits and 5xx server errors
+_RECOVERABLE_ERROR_RE = re.compile(r"\b(?:timeout|timed out|rate\s*limit|server\s*error|5\d\d|429)\b", re.IGNORECASE)
+
+# A whitespace-delimited word starting with '#', as TickTick parses tags in titles
+_HASHTAG_RE = re.compile(r"(?:^|\s)(#\S+)")
+
+_ENV_KEYS = ("TICKTICK_CLIENT_ID", "TICKTICK_CLIENT_SECRET",
+             "TICKTICK_ACCESS_TOKEN", "TICKTICK_REFRESH_TOKEN")
+
+def _retry_after_seconds(value: Optional[str]) -> Optional[float]:
+    """Parses a Retry-After header given as delta-seconds or an HTTP date."""
+    if not value:
+        return None
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+class _RateLimiter:
+    """
+    Thread-safe token bucket allowing `rate` acquisitions per second.
+    
+    The rate adapts AIMD-style: it halves on each rate-limit response and grows
+    back by one per 100 consecutive successes, up to the configured ceiling.
+    """
+    
+    def __init__(self, rate: float):
+        self.ceiling = rate
+        self.rate = rate
+        self._tokens = max(1.0, rate)
+        self._updated = time.monotonic()
+        self._successes = 0
+        self._lock = threading.Lock()
+    
+    def acquire(self) -> None:
+        """Block until a token is available."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                # Hold at least one whole token so rates below 1/s still make progress
+                self._tokens = min(max(1.0, self.rate), self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+    
+    def backoff(self) -> None:
+        """Halve the rate after the server rate limited a request."""
+        with self._lock:
+            # Floor at one request per second (or the configured rate, if lower)
+            self.rate = max(min(1.0, self.ceiling), self.rate / 2)
+            self._tokens = min(self._tokens, max(1.0, self.rate))
+            self._successes = 0
+        logger.warning("Rate limited; pacing writes at %g requests/second", self.rate)
+    
+    def record_success(self) -> None:
+        """Count a successful request, raising the rate by one every 100 in a row."""
+        with self._lock:
+            if self.rate >= self.ceiling:
+                return
+            self._successes += 1
+            if self._successes >= 100:
+                self.rate = min(self.ceiling, self.rate + 1)
+                self._successes = 0
+
+class _CircuitBreaker:
+    """
+    Fails fast after repeated outage-type failures (timeouts, connection errors, 5xx).
+    
+    After failure_threshold consecutive failures the circuit opens and requests are
+    rejected for reset_timeout seconds. The circuit then goes half-open and admits
+    one probe at a time; success_threshold successful probes close it again, a
+    failure reopens it.
+    """
+    
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0, success_threshold: int = 2):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.success_threshold = success_threshold
+        self._failures = 0
+        self._successes = 0
+        self._opened_at: Optional[float] = None
+        self._probe_started: Optional[float] = None
+        self._lock = threading.Lock()
+    
+    def retry_after(self) -> float:
+        """
+        Seconds until requests may be sent again; 0 admits the request.
+        
+        While half-open only one probe is admitted at a time, and the caller it
+        admits must report back through record() or release(). A probe that
+        never does is given up on after reset_timeout.
+        """
+        with self._lock:
+            if self._opened_at is None:
+                return 0.0
+            now = time.monotonic()
+            wait = self._opened_at + self.reset_timeout - now
+            if wait > 0:
+                return wait
+            if self._probe_started is not None and now - self._probe_started < self.reset_timeout:
+                return 1.0
+            self._probe_started = now
+            return 0.0
+    
+    def release(self) -> None:
+        """Free the half-open probe slot without recording an outcome."""
+        with self._lock:
+            self._probe_started = None
+    
+    def record(self, ok: bool) -> None:
+        """Record the outcome of a request that reached (or failed to reach) the server."""
+        with self._lock:
+            self._probe_started = None
+            if ok:
+                self._failures = 0
+                if self._opened_at is not None:
+                    self._successes += 1
+                    if self._successes >= self.success_threshold:
+                        logger.info("TickTick API recovered. Circuit closed.")
+                        self._opened_at = None
+                        self._successes = 0
+                return
+            
+            self._successes = 0
+            self._failures += 1
+            if self._opened_at is not None or self._failures >= self.failure_threshold:
+                if self._opened_at is None:
+                    logger.warning("%s consecutive API failures. Circuit opened for %.0fs.", self._failures, self.reset_timeout)
+                self._opened_at = time.monotonic()
+
 class TickTickClient:
     """
     Client for the TickTick API using OAuth2 authentication.
     """
     
+    _HTTP_METHODS = frozenset({"GET", "POST", "PUT", "DELETE"})
+    _TRANSIENT_STATUSES = frozenset({502, 503, 504})
+    
+    # Descriptive error codes for common 4xx statuses
+    _CLIENT_ERROR_CODES = {
+        400: "BAD_REQUEST",
+        403: "FORBIDDEN",
+        405: "METHOD_NOT_ALLOWED",
+        409: "CONFLICT",
+        413: "PAYLOAD_TOO_LARGE",
+        415: "UNSUPPORTED_MEDIA_TYPE",
+        422: "VALIDATION_ERROR"
+    }
+    
+    _ETAG_CACHE_SIZE = 256
+    
+    # Seconds a task returned by update_task is reused as the base for the next update
+    _RECENT_TASK_TTL = 5.0
+    
+    # Seconds find_task answers from a project's task listing before fetching it again
+    _TASK_INDEX_TTL = 5.0
+    
+    # Exceptions raised while sending a request, most specific first:
+    # (type, error_code, message template, is_transient)
+    _REQUEST_ERRORS = (
+        (requests.exceptions.Timeout, "TIMEOUT",
+         "Request timed out after {timeout} seconds: {e}", True),
+        (requests.exceptions.ConnectionError, "CONNECTION_ERROR",
+         "Unable to connect to TickTick API. Please check your internet connection.", True),
+        (requests.exceptions.RequestException, "REQUEST_FAILED",
+         "API request failed: {e}", False),
+        (Exception, "UNEXPECTED_ERROR",
+         "Unexpected error during API request: {e}", False),
+    )
+    
+    # Fallback error details for responses with an empty body
+    _STATUS_DESCRIPTIONS = {
+        400: "Bad Request",
+        401: "Unauthorized",
+        403: "Forbidden",
+        404: "Not Found",
+        405: "Method Not Allowed",
+        409: "Conflict",
+        429: "Too Many Requests",
+        500: "Internal Server Error",
+        502: "Bad Gateway",
+        503: "Service Unavailable",
+        504: "Gateway Timeout"
+    }
+    
+    # create_tasks input fields mapped to API keys
+    _BATCH_TASK_TEXT_FIELDS = (("content", "content"), ("start_date", "startDate"),
+                               ("due_date", "dueDate"), ("repeat_flag", "repeatFlag"))
+    _BATCH_TASK_FLAG_FIELDS = (("priority", "priority"), ("is_all_day", "isAllDay"))
+    
+    # Server-managed task fields stripped from update payloads
+    _READ_ONLY_TASK_FIELDS = frozenset({"createdTime", "completedTime", "modifiedTime",
+                                        "etag", "timeZone", "sortOrder"})
+    
     def __init__(self):
-        load_dotenv()
+        # The server has usually loaded .env already; only parse it when something is missing
+        if not all(os.getenv(key) for key in _ENV_KEYS):
+            load_dotenv()
         self.client_id = os.getenv("TICKTICK_CLIENT_ID")
         self.client_secret = os.getenv("TICKTICK_CLIENT_SECRET")
         self.access_token = os.getenv("TICKTICK_ACCESS_TOKEN")
@@ -34,6 +270,113 @@ class TickTickClient:
             "Authorization": f"Bearer {self.access_token}",
             "Content-Type": "application/json"
         }
+        
+        # Client credentials don't change during the process, so encode them once
+        self._basic_auth_header = None
+        if self.client_id and self.client_secret:
+            auth_b64 = base64.b64encode(f"{self.client_id}:{self.client_secret}".encode('ascii')).decode('ascii')
+            self._basic_auth_header = f"Basic {auth_b64}"
+        
+        # Monotonic deadline for a proactive refresh, known once we have refreshed
+        # ourselves (tokens loaded from .env carry no expiry and rely on the 401 path)
+        self._token_expiry: Optional[float] = None
+        self._refresh_lock = threading.Lock()
+        
+        # Upper bound on concurrent DELETE requests in delete_projects
+        self.delete_concurrency = max(1, int(os.getenv("TICKTICK_DELETE_CONCURRENCY", "10")))
+        
+        # Client-side cap on write requests per second so bulk operations stay
+        # under TickTick's rate limit instead of tripping 429s (0 disables it)
+        write_rps = float(os.getenv("TICKTICK_RPS", "5"))
+        self._write_limiter = _RateLimiter(write_rps) if write_rps > 0 else None
+        
+        # Monotonic time until which the server has asked us to back off (429)
+        self._blocked_until = 0.0
+        
+        # Stops bulk operations from hammering the API during an outage
+        self._breaker = _CircuitBreaker()
+        
+        # Reuse one session so requests share pooled keep-alive connections.
+        # The pool is sized for the concurrent fetches in get_all_projects_with_data
+        # and delete_projects. Connection failures (e.g. a stale keep-alive socket)
+        # and transient gateway errors are retried here with exponential backoff;
+        # the last response is returned rather than raised so _handle_response maps it.
+        # Status retries are limited to idempotent methods: a 502/504 on a POST may
+        # follow a committed write, and replaying it would create duplicates.
+        self._session = requests.Session()
+        self._session.mount("https://", HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=max(16, self.delete_concurrency),
+            max_retries=Retry(
+                total=3, connect=3, read=0, status=2,
+                backoff_factor=0.5,
+                status_forcelist=self._TRANSIENT_STATUSES,
+                allowed_methods=frozenset({"GET", "DELETE"}),
+                respect_retry_after_header=True,
+                raise_on_status=False,
+            ),
+        ))
+        
+        # Upper bound on each API call so a stalled server can't hang a tool
+        self.timeout = float(os.getenv("TICKTICK_TIMEOUT", "30"))
+        
+        # Short-lived cache for project reads, keyed by resource tuple
+        self.cache_ttl = float(os.getenv("TICKTICK_CACHE_TTL", "60"))
+        self._cache: Dict[Tuple, Tuple[float, Any]] = {}
+        
+        # Last ETag and parsed body per GET URL, revalidated with If-None-Match
+        # once the TTL cache above has expired (oldest entries evicted first)
+        self._etag_cache: Dict[str, Tuple[str, Any]] = {}
+        self._etag_lock = threading.Lock()
+    
+    def close(self) -> None:
+        """Close the underlying HTTP session and its pooled connections."""
+        self._session.close()
+    
+    def _cached(self, key: Tuple, fetch, share: bool = False, ttl: float = None) -> Any:
+        """
+        Return a cached response for key, calling fetch() on a miss or expiry.
+        
+        Callers get a deep copy so mutating a result can't alter the cache;
+        share=True returns the cached object itself for internal read-only use.
+        ttl overrides cache_ttl for entries that must stay fresher. Error
+        responses are never cached so transient failures are retried on the
+        next call.
+        """
+        now = time.monotonic()
+        hit = self._cache.get(key)
+        if hit and now - hit[0] < (self.cache_ttl if ttl is None else ttl):
+            return hit[1] if share else copy.deepcopy(hit[1])
+        
+        result = fetch()
+        if self.cache_ttl > 0 and not (isinstance(result, dict) and 'error' in result):
+            self._cache[key] = (now, result)
+            if not share:
+                return copy.deepcopy(result)
+        return result
+    
+    def invalidate_cache(self, project_id: str = None) -> None:
+        """
+        Drop cached project reads.
+        
+        Args:
+            project_id: Only drop entries for this project (optional). When
+                omitted, the whole cache is cleared.
+        """
+        if project_id is None:
+            self._cache.clear()
+            return
+        self._cache.pop(("project", project_id), None)
+        self._cache.pop(("project_data", project_id), None)
+        self._cache.pop(("task_index", project_id), None)
+        for key in [key for key in list(self._cache) if key[0] == "task" and key[1] == project_id]:
+            self._cache.pop(key, None)
+    
+    def _invalidate_project_list(self) -> None:
+        """Drop the cached project lists after a project is created, updated or deleted."""
+        self._cache.pop(("projects",), None)
+        self._cache.pop(("projects_sorted",), None)
+        self._cache.pop(("projects_by_name",), None)
     
     def _refresh_access_token(self) -> bool:
         """
@@ -56,19 +399,14 @@ class TickTickClient:
             "refresh_token": self.refresh_token
         }
         
-        # Prepare Basic Auth credentials
-        auth_str = f"{self.client_id}:{self.client_secret}"
-        auth_bytes = auth_str.encode('ascii')
-        auth_b64 = base64.b64encode(auth_bytes).decode('ascii')
-        
         headers = {
-            "Authorization": f"Basic {auth_b64}",
+            "Authorization": self._basic_auth_header,
             "Content-Type": "application/x-www-form-urlencoded"
         }
         
         try:
             # Send the token request
-            response = requests.post(self.token_url, data=token_data, headers=headers)
+            response = self._session.post(self.token_url, data=token_data, headers=headers, timeout=self.timeout)
             response.raise_for_status()
             
             # Parse the response
@@ -78,6 +416,8 @@ class TickTickClient:
             self.access_token = tokens.get('access_token')
             if 'refresh_token' in tokens:
                 self.refresh_token = tokens.get('refresh_token')
+            # Refresh a minute early so requests never race the expiry
+            self._token_expiry = time.monotonic() + int(tokens.get('expires_in', 3600)) - 60
                 
             # Update the headers
             self.headers["Authorization"] = f"Bearer {self.access_token}"
@@ -89,9 +429,35 @@ class TickTickClient:
             return True
             
         except requests.exceptions.RequestException as e:
-            logger.error(f"Error refreshing access token: {e}")
+            logger.error("Error refreshing access token: %s", e)
             return False
     
+    def _ensure_token(self, stale_token: str = None) -> bool:
+        """
+        Refresh the access token when it is about to expire or was rejected.
+        
+        The refresh is serialized and re-checked under a lock so concurrent
+        callers that hit the same expiry trigger only one token request.
+        
+        Args:
+            stale_token: Token a request was rejected with (optional). When given,
+                refresh unless another caller has already replaced it.
+        
+        Returns:
+            True if the current token is usable, False if a needed refresh failed
+        """
+        def needs_refresh() -> bool:
+            if stale_token is not None:
+                return self.access_token == stale_token
+            return self._token_expiry is not None and time.monotonic() >= self._token_expiry
+        
+        if not needs_refresh():
+            return True
+        with self._refresh_lock:
+            if not needs_refresh():
+                return True
+            return self._refresh_access_token()
+    
     def _save_tokens_to_env(self, tokens: Dict[str, str]) -> None:
         """
         Save the tokens to the .env file.
@@ -99,37 +465,42 @@ class TickTickClient:
         Args:
             tokens: A dictionary containing the access_token and optionally refresh_token
         """
-        # Load existing .env file content
+        # Update only the changed keys in place, keeping the rest of the file intact
         env_path = Path('.env')
-        env_content = {}
-        
-        if env_path.exists():
-            with open(env_path, 'r') as f:
-                for line in f:
-                    line = line.strip()
-                    if line and not line.startswith('#') and '=' in line:
-                        key, value = line.split('=', 1)
-                        env_content[key] = value
-        
-        # Update with new tokens
-        env_content["TICKTICK_ACCESS_TOKEN"] = tokens.get('access_token', '')
+        lines = env_path.read_text().splitlines() if env_path.exists() else []
+        existing = {
+            key.strip()
+            for key, sep, _ in (line.partition('=') for line in lines)
+            if sep and not key.lstrip().startswith('#')
+        }
+        
+        updates = {"TICKTICK_ACCESS_TOKEN": tokens.get('access_token', '')}
         if 'refresh_token' in tokens:
-            env_content["TICKTICK_REFRESH_TOKEN"] = tokens.get('refresh_token', '')
+            updates["TICKTICK_REFRESH_TOKEN"] = tokens.get('refresh_token', '')
         
         # Make sure client credentials are saved as well
-        if self.client_id and "TICKTICK_CLIENT_ID" not in env_content:
-            env_content["TICKTICK_CLIENT_ID"] = self.client_id
-        if self.client_secret and "TICKTICK_CLIENT_SECRET" not in env_content:
-            env_content["TICKTICK_CLIENT_SECRET"] = self.client_secret
+        if self.client_id and "TICKTICK_CLIENT_ID" not in existing:
+            updates["TICKTICK_CLIENT_ID"] = self.client_id
+        if self.client_secret and "TICKTICK_CLIENT_SECRET" not in existing:
+            updates["TICKTICK_CLIENT_SECRET"] = self.client_secret
         
-        # Write back to .env file
-        with open(env_path, 'w') as f:
-            for key, value in env_content.items():
-                f.write(f"{key}={value}\n")
+        # Rewrite matching lines and append new keys in a single pass, swapping the file in atomically
+        output = []
+        for line in lines:
+            key, sep, _ = line.partition('=')
+            key = key.strip()
+            if sep and key in updates:
+                line = f"{key}={updates.pop(key)}"
+            output.append(line)
+        output.extend(f"{key}={value}" for key, value in updates.items())
+        
+        tmp_path = env_path.with_name(env_path.name + '.tmp')
+        tmp_path.write_text("\n".join(output) + "\n")
+        os.replace(tmp_path, env_path)
         
         logger.debug("Tokens saved to .env file")
     
-    def _make_request(self, method: str, endpoint: str, data=None, timeout: int = 30, retry_on_error: bool = True) -> Dict:
+    def _make_request(self, method: str, endpoint: str, data=None, timeout: float = None, retry_on_error: bool = True) -> Dict:
         """
         Makes a request to the TickTick API with enhanced error handling.
         
@@ -137,55 +508,84 @@ class TickTickClient:
             method: HTTP method (GET, POST, PUT, DELETE)
             endpoint: API endpoint (without base URL)
             data: Request data (for POST, PUT)
-            timeout: Request timeout in seconds (default: 30)
-            retry_on_error: Whether to retry on specific transient errors (default: True)
+            timeout: Request timeout in seconds (default: TICKTICK_TIMEOUT, 30)
+            retry_on_error: Whether to retry a short rate-limit back-off on reads (default: True)
         
         Returns:
             API response as a dictionary with consistent error format
         """
         url = f"{self.base_url}{endpoint}"
+        if timeout is None:
+            timeout = self.timeout
         
         try:
             # Log request details for debugging
-            logger.debug(f"Making {method} request to {url}")
-            if data:
-                logger.debug(f"Request data: {json.dumps(data, indent=2)}")
-            
-            # Request options for all requests
-            request_options = {
-                "headers": self.headers,
-                "timeout": timeout
-            }
+            logger.debug("Making %s request to %s", method, url)
             
-            # Make the request
-            if method == "GET":
-                response = requests.get(url, **request_options)
-            elif method == "POST":
-                response = requests.post(url, json=data, **request_options)
-            elif method == "DELETE":
-                response = requests.delete(url, **request_options)
-            else:
+            if method not in self._HTTP_METHODS:
                 raise ValueError(f"Unsupported HTTP method: {method}")
+            body = _json_dumps(data) if data is not None else None
+            if data and logger.isEnabledFor(logging.DEBUG):
+                # Log the encoded body rather than serializing the payload twice
+                logger.debug("Request data: %s", body.decode("utf-8"))
+            
+            cached = self._etag_cache.get(url) if method == "GET" else None
+            
+            def send() -> requests.Response:
+                # Headers are read per send so a retry picks up a refreshed token
+                headers = {**self.headers, "If-None-Match": cached[0]} if cached else self.headers
+                if _REQUEST_SECONDS is None:
+                    return self._session.request(method, url, data=body, headers=headers, timeout=timeout)
+                started = time.perf_counter()
+                response = self._session.request(method, url, data=body, headers=headers, timeout=timeout)
+                _REQUEST_SECONDS.labels(method, _ID_SEGMENT_RE.sub("/{id}", endpoint), response.status_code).observe(time.perf_counter() - started)
+                return response
+            
+            # Don't spend a round trip on a call the server would rate limit anyway
+            wait = self._blocked_until - time.monotonic()
+            if wait > 0:
+                retry_after = str(math.ceil(wait))
+                logger.warning("Rate limit back-off in effect. Skipping %s %s for %s more seconds.", method, endpoint, retry_after)
+                return {
+                    "error": f"TickTick API rate limit exceeded. Please try again after {retry_after} seconds.",
+                    "error_code": "RATE_LIMITED",
+                    "status": "failed",
+                    "http_status": 429,
+                    "retry_after": retry_after
+                }
+            
+            wait = self._breaker.retry_after()
+            if wait > 0:
+                return {
+                    "error": f"TickTick API is unavailable after repeated failures. Not sending requests for {math.ceil(wait)} more seconds.",
+                    "error_code": "CIRCUIT_OPEN",
+                    "status": "failed",
+                    "retry_after": str(math.ceil(wait))
+                }
+            
+            # Refresh ahead of expiry instead of paying for a rejected request
+            self._ensure_token()
+            token = self.access_token
+            
+            # Pace writes, which are what bulk operations issue in bursts
+            if method != "GET" and self._write_limiter:
+                self._write_limiter.acquire()
+            
+            # Make the request
+            response = send()
             
             # CASE 1: Authentication issues (401)
             if response.status_code == 401:
                 logger.info("Access token expired. Attempting to refresh...")
                 
                 # Try to refresh the access token
-                if self._refresh_access_token():
+                if self._ensure_token(stale_token=token):
                     logger.info("Token refreshed. Retrying request...")
-                    # Update headers with new token
-                    request_options["headers"] = self.headers
-                    
-                    # Retry the request with the new token
-                    if method == "GET":
-                        response = requests.get(url, **request_options)
-                    elif method == "POST":
-                        response = requests.post(url, json=data, **request_options)
-                    elif method == "DELETE":
-                        response = requests.delete(url, **request_options)
+                    response = send()
                 else:
                     logger.error("Failed to refresh token. Authentication required.")
+                    # The server answered, so this counts as reachable for the breaker
+                    self._breaker.record(True)
                     return {
                         "error": "Authentication failed. Your access token is expired or invalid.",
                         "error_code": "AUTH_FAILED",
@@ -193,167 +593,195 @@ class TickTickClient:
                         "resolution": "Please run 'uv run -m ticktick_mcp.cli auth' to reauthenticate."
                     }
             
-            # CASE 2: Resource not found (404)
-            if response.status_code == 404:
-                error_detail = self._extract_error_details(response)
-                resource_type = "task" if "/task/" in endpoint else "project" if "/project/" in endpoint else "resource"
-                
-                logger.warning(f"{resource_type.capitalize()} not found: {endpoint} - {error_detail}")
-                return {
-                    "error": f"{resource_type.capitalize()} not found. It may have been deleted or never existed.",
-                    "error_code": "NOT_FOUND",
-                    "status": "failed",
-                    "http_status": 404,
-                    "details": error_detail
-                }
+            # Record before any re-read so a half-open probe slot is released first
+            self._breaker.record(response.status_code < 500)
+            
+            # Transient 5xx responses were already retried by the session adapter.
+            # Reads are safe to repeat, so also wait out a short rate-limit back-off once
+            if retry_on_error and response.status_code == 429 and method == "GET":
+                retry_after = _retry_after_seconds(response.headers.get('Retry-After'))
+                if retry_after is not None and retry_after <= 5:
+                    logger.warning("Rate limited. Retrying in %g seconds...", retry_after)
+                    if _RETRIES is not None:
+                        _RETRIES.labels("get").inc()
+                    time.sleep(retry_after)
+                    return self._make_request(method, endpoint, data, timeout, False)
+            
+            if method != "GET" and self._write_limiter:
+                if response.status_code == 429:
+                    self._write_limiter.backoff()
+                elif response.status_code < 400:
+                    self._write_limiter.record_success()
+            
+            # Unchanged since the last fetch: reuse the parsed body
+            if response.status_code == 304 and cached:
+                return copy.deepcopy(cached[1])
             
-            # CASE 3: Rate limiting (429)
             if response.status_code == 429:
-                retry_after = response.headers.get('Retry-After', '60')
-                error_detail = self._extract_error_details(response)
+                # Hold further calls until the server's back-off has passed
+                retry_after = _retry_after_seconds(response.headers.get('Retry-After'))
+                self._blocked_until = time.monotonic() + (retry_after if retry_after is not None else 60)
+            
+            result = self._handle_response(response, endpoint)
+            etag = response.headers.get('ETag')
+            if method == "GET" and etag and not (isinstance(result, dict) and 'error' in result):
+                self._remember_etag(url, etag, result)
+            return result
                 
-                logger.warning(f"Rate limit exceeded. Retry after {retry_after} seconds.")
-                return {
-                    "error": f"TickTick API rate limit exceeded. Please try again after {retry_after} seconds.",
-                    "error_code": "RATE_LIMITED",
-                    "status": "failed",
-                    "http_status": 429,
-                    "retry_after": retry_after,
-                    "details": error_detail
-                }
+        except Exception as e:
+            if isinstance(e, (requests.exceptions.Timeout, requests.exceptions.ConnectionError)):
+                self._breaker.record(False)
+            else:
+                # Says nothing about the server's health, but must not strand a half-open probe
+                self._breaker.release()
+            return self._request_error(e, timeout)
+    
+    def _request_error(self, e: Exception, timeout: float) -> Dict:
+        """Maps an exception raised while sending a request to a structured error dictionary."""
+        for exc_type, error_code, message, is_transient in self._REQUEST_ERRORS:
+            if isinstance(e, exc_type):
+                break
+        
+        logger.error("%s during API request: %s", error_code, e)
+        error = {
+            "error": message.format(e=e, timeout=timeout),
+            "error_code": error_code,
+            "status": "failed",
+            "details": str(e)
+        }
+        if is_transient:
+            error["is_transient"] = True
+        return error
+    
+    def _remember_etag(self, url: str, etag: str, result: Any) -> None:
+        """Stores a GET response for If-None-Match revalidation, bounded to _ETAG_CACHE_SIZE URLs."""
+        with self._etag_lock:
+            self._etag_cache.pop(url, None)
+            if len(self._etag_cache) >= self._ETAG_CACHE_SIZE:
+                self._etag_cache.pop(next(iter(self._etag_cache)))
+            self._etag_cache[url] = (etag, copy.deepcopy(result))
+    
+    def _handle_response(self, response: requests.Response, endpoint: str) -> Any:
+        """
+        Maps a final API response to parsed data or a structured error dictionary.
+        
+        Args:
+            response: Response to map (after any token refresh or retry)
+            endpoint: API endpoint the response came from, used in error messages
+        
+        Returns:
+            Parsed JSON data, a success dictionary for empty bodies, or an error dictionary
+        """
+        if response.status_code >= 400:
+            return self._build_error(response, endpoint)
+        
+        # CASE 6: Success with no content (204)
+        if response.status_code == 204:
+            return {
+                "success": True,
+                "status": "success",
+                "message": "Operation completed successfully",
+                "http_status": 204
+            }
+        
+        # CASE 7: Success with content (200)
+        # Parse and validate the response
+        try:
+            result = _json_loads(response.content)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("API response: %s", response.text)
             
-            # CASE 4: Server errors (5xx)
-            if response.status_code >= 500:
-                error_detail = self._extract_error_details(response)
-                
-                # Determine if this is a transient error we might want to retry
-                is_transient = response.status_code in (502, 503, 504)
-                
-                if is_transient and retry_on_error:
-                    logger.warning(f"Transient server error ({response.status_code}). Retrying request...")
-                    # Wait briefly before retrying
-                    time.sleep(1)
-                    # Retry with retry_on_error=False to prevent infinite retries
-                    return self._make_request(method, endpoint, data, timeout, False)
-                
-                logger.error(f"Server error: {response.status_code} - {error_detail}")
-                return {
-                    "error": f"TickTick server error (HTTP {response.status_code}). Please try again later.",
-                    "error_code": "SERVER_ERROR",
-                    "status": "failed",
-                    "http_status": response.status_code,
-                    "details": error_detail,
-                    "is_transient": is_transient
-                }
+            # Add standard success fields if they're not already present
+            if isinstance(result, dict) and "status" not in result:
+                result["status"] = "success"
             
-            # CASE 5: Other client errors (4xx)
-            if response.status_code >= 400:
-                error_detail = self._extract_error_details(response)
-                
-                # Map common status codes to more descriptive error codes
-                error_code_map = {
-                    400: "BAD_REQUEST",
-                    403: "FORBIDDEN",
-                    405: "METHOD_NOT_ALLOWED",
-                    409: "CONFLICT",
-                    413: "PAYLOAD_TOO_LARGE",
-                    415: "UNSUPPORTED_MEDIA_TYPE",
-                    422: "VALIDATION_ERROR"
-                }
-                
-                error_code = error_code_map.get(response.status_code, f"CLIENT_ERROR_{response.status_code}")
-                
-                logger.error(f"Client error: {response.status_code} - {error_detail}")
+            return result
+        except json.JSONDecodeError:
+            if response.text:
+                logger.warning("Received non-JSON response: %s...", response.text[:100])
                 return {
-                    "error": f"Request error: {error_detail}",
-                    "error_code": error_code,
-                    "status": "failed",
+                    "error": f"Invalid JSON response from TickTick API",
+                    "error_code": "INVALID_RESPONSE_FORMAT",
+                    "status": "warning",
                     "http_status": response.status_code,
-                    "details": error_detail
-                }
-            
-            # CASE 6: Success with no content (204)
-            if response.status_code == 204:
-                return {
-                    "success": True,
-                    "status": "success",
-                    "message": "Operation completed successfully",
-                    "http_status": 204
+                    "raw_response": response.text[:1000]  # Limit to 1000 chars
                 }
             
-            # CASE 7: Success with content (200)
-            # Parse and validate the response
-            try:
-                result = response.json()
-                logger.debug(f"API response: {json.dumps(result, indent=2)}")
-                
-                # Add standard success fields if they're not already present
-                if isinstance(result, dict) and "status" not in result:
-                    result["status"] = "success"
-                
-                return result
-            except json.JSONDecodeError:
-                if response.text:
-                    logger.warning(f"Received non-JSON response: {response.text[:100]}...")
-                    return {
-                        "error": f"Invalid JSON response from TickTick API",
-                        "error_code": "INVALID_RESPONSE_FORMAT",
-                        "status": "warning",
-                        "http_status": response.status_code,
-                        "raw_response": response.text[:1000]  # Limit to 1000 chars
-                    }
-                
-                # Empty response but success status code
-                return {
-                    "success": True,
-                    "status": "success",
-                    "message": "Operation completed successfully",
-                    "http_status": response.status_code
-                }
-                
-        except requests.exceptions.Timeout as e:
-            error_message = f"Request timed out after {timeout} seconds: {str(e)}"
-            logger.error(error_message)
+            # Empty response but success status code
             return {
-                "error": error_message,
-                "error_code": "TIMEOUT",
-                "status": "failed",
-                "is_transient": True
+                "success": True,
+                "status": "success",
+                "message": "Operation completed successfully",
+                "http_status": response.status_code
             }
-        except requests.exceptions.ConnectionError as e:
-            error_message = f"Connection error: {str(e)}"
-            logger.error(error_message)
+    
+    def _build_error(self, response: requests.Response, endpoint: str) -> Dict:
+        """Maps an error response (status >= 400) to a structured error dictionary."""
+        error_detail = self._extract_error_details(response)
+        
+        # CASE 2: Resource not found (404)
+        if response.status_code == 404:
+            resource_type = "task" if "/task/" in endpoint else "project" if "/project/" in endpoint else "resource"
+            
+            logger.warning("%s not found: %s - %s", resource_type.capitalize(), endpoint, error_detail)
             return {
-                "error": "Unable to connect to TickTick API. Please check your internet connection.",
-                "error_code": "CONNECTION_ERROR",
+                "error": f"{resource_type.capitalize()} not found. It may have been deleted or never existed.",
+                "error_code": "NOT_FOUND",
                 "status": "failed",
-                "is_transient": True,
-                "details": str(e)
+                "http_status": 404,
+                "details": error_detail
             }
-        except requests.exceptions.RequestException as e:
-            error_message = f"API request failed: {str(e)}"
-            logger.error(error_message)
+        
+        # CASE 3: Rate limiting (429)
+        if response.status_code == 429:
+            seconds = _retry_after_seconds(response.headers.get('Retry-After'))
+            retry_after = str(math.ceil(seconds)) if seconds is not None else '60'
+            logger.warning("Rate limit exceeded. Retry after %s seconds.", retry_after)
             return {
-                "error": error_message,
-                "error_code": "REQUEST_FAILED",
+                "error": f"TickTick API rate limit exceeded. Please try again after {retry_after} seconds.",
+                "error_code": "RATE_LIMITED",
                 "status": "failed",
-                "details": str(e)
+                "http_status": 429,
+                "retry_after": retry_after,
+                "details": error_detail
             }
-        except Exception as e:
-            error_message = f"Unexpected error during API request: {str(e)}"
-            logger.error(error_message)
-            return {
-                "error": error_message,
-                "error_code": "UNEXPECTED_ERROR",
+        
+        # CASE 4: Server errors (5xx)
+        if response.status_code >= 500:
+            is_transient = response.status_code in self._TRANSIENT_STATUSES
+            
+            logger.error("Server error: %s - %s", response.status_code, error_detail)
+            error = {
+                "error": f"TickTick server error (HTTP {response.status_code}). Please try again later.",
+                "error_code": "SERVER_ERROR",
                 "status": "failed",
-                "details": str(e)
+                "http_status": response.status_code,
+                "details": error_detail,
+                "is_transient": is_transient
             }
-            
+            seconds = _retry_after_seconds(response.headers.get('Retry-After'))
+            if seconds is not None:
+                error["retry_after"] = str(math.ceil(seconds))
+            return error
+        
+        # CASE 5: Other client errors (4xx)
+        # Map common status codes to more descriptive error codes
+        error_code = self._CLIENT_ERROR_CODES.get(response.status_code, f"CLIENT_ERROR_{response.status_code}")
+        
+        logger.error("Client error: %s - %s", response.status_code, error_detail)
+        return {
+            "error": f"Request error: {error_detail}",
+            "error_code": error_code,
+            "status": "failed",
+            "http_status": response.status_code,
+            "details": error_detail
+        }
+    
     def _extract_error_details(self, response):
         """Extract error details from response object."""
         try:
             # Try to parse as JSON first
-            error_detail = response.json()
+            error_detail = _json_loads(response.content)
             if isinstance(error_detail, dict) and 'error' in error_detail:
                 return error_detail['error']
             return json.dumps(error_detail)
@@ -363,40 +791,110 @@ class TickTickClient:
                 return response.text
             
             # Map status codes to descriptions
-            status_descriptions = {
-                400: "Bad Request",
-                401: "Unauthorized",
-                403: "Forbidden",
-                404: "Not Found",
-                405: "Method Not Allowed",
-                409: "Conflict",
-                429: "Too Many Requests",
-                500: "Internal Server Error",
-                502: "Bad Gateway",
-                503: "Service Unavailable",
-                504: "Gateway Timeout"
-            }
-            
-            return status_descriptions.get(response.status_code, f"HTTP {response.status_code}")
+            return self._STATUS_DESCRIPTIONS.get(response.status_code, f"HTTP {response.status_code}")
     
     # Project methods
     def get_projects(self) -> List[Dict]:
         """Gets all projects for the user."""
+        return self._cached(("projects",), self._fetch_projects)
+    
+    def get_projects_sorted(self) -> List[Dict]:
+        """Gets all projects sorted by name (case-insensitive)."""
+        def fetch():
+            projects = self.get_projects()
+            if not isinstance(projects, list):
+                return projects
+            return sorted(projects, key=lambda p: p.get('name', '').lower())
+        return self._cached(("projects_sorted",), fetch)
+    
+    def find_project_by_name(self, name: str) -> Optional[Dict]:
+        """
+        Finds a project by exact name using a cached name index.
+        
+        Returns:
+            The first project with that name, None if there is none, or an error
+            dictionary if the project list could not be fetched
+        """
+        def fetch():
+            projects = self._cached(("projects",), self._fetch_projects, share=True)
+            if not isinstance(projects, list):
+                return projects
+            by_name = {}
+            for project in projects:
+                by_name.setdefault(project.get('name'), project)
+            return by_name
+        
+        # Share the index and copy only the project it answers with
+        index = self._cached(("projects_by_name",), fetch, share=True)
+        if isinstance(index.get('error'), str):
+            # Index values are project dicts, so a string here is a fetch error
+            return index
+        project = index.get(name)
+        return copy.deepcopy(project) if project is not None else None
+    
+    @staticmethod
+    def project_identifier(project: Dict) -> str:
+        """Returns a human-readable 'Name (ID: id)' label for a project."""
+        return f"{project.get('name', '')} (ID: {project.get('id', '')})"
+    
+    def _fetch_projects(self) -> List[Dict]:
+        """Fetches all projects from the API, bypassing the cache."""
         result = self._make_request("GET", "/project")
         if isinstance(result, list):
-            # Add a visible identifier to each project
+            now = time.monotonic()
             for project in result:
-                if 'id' in project and 'name' in project:
-                    project['identifier'] = f"{project['name']} (ID: {project['id']})"
+                # Prime single-project reads so get_project is served from the list
+                if self.cache_ttl > 0 and 'id' in project:
+                    self._cache[("project", project['id'])] = (now, project)
         return result
     
     def get_project(self, project_id: str) -> Dict:
         """Gets a specific project by ID."""
-        return self._make_request("GET", f"/project/{project_id}")
+        return self._cached(("project", project_id),
+                            lambda: self._make_request("GET", f"/project/{project_id}"))
     
     def get_project_with_data(self, project_id: str) -> Dict:
         """Gets project with tasks and columns."""
-        return self._make_request("GET", f"/project/{project_id}/data")
+        return self._cached(("project_data", project_id),
+                            lambda: self._make_request("GET", f"/project/{project_id}/data"))
+    
+    def get_all_projects_with_data(self, projects: List[Dict] = None, max_workers: int = 8) -> List[Tuple[Dict, Dict]]:
+        """
+        Gets project data (tasks and columns) for many projects in one call.
+        
+        The TickTick Open API has no bulk endpoint for this, so the per-project
+        requests are issued concurrently from a small thread pool.
+        
+        Args:
+            projects: Projects to fetch data for (optional, defaults to all projects)
+            max_workers: Maximum number of concurrent requests (default: 8)
+        
+        Returns:
+            List of (project, project_data) pairs in input order, or an error dictionary
+            if the project list could not be fetched. Failed fetches are returned as
+            error dictionaries in place of the project data.
+        """
+        if projects is None:
+            projects = self.get_projects()
+            if isinstance(projects, dict) and 'error' in projects:
+                return projects
+        
+        def fetch(project: Dict) -> Dict:
+            try:
+                return self.get_project_with_data(project.get('id'))
+            except Exception as e:
+                return {
+                    "error": f"Failed to fetch project data: {str(e)}",
+                    "error_code": "UNEXPECTED_ERROR",
+                    "status": "failed"
+                }
+        
+        if not projects:
+            return []
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(fetch, projects))
+        return list(zip(projects, results))
     
     def create_project(self, name: str, color: str = "#F18181", view_mode: str = "list", kind: str = "TASK") -> Dict:
         """Creates a new project."""
@@ -406,7 +904,9 @@ class TickTickClient:
             "viewMode": view_mode,
             "kind": kind
         }
-        return self._make_request("POST", "/project", data)
+        result = self._make_request("POST", "/project", data)
+        self._invalidate_project_list()
+        return result
     
     def update_project(self, project_id: str, name: str = None, color: str = None, 
                        view_mode: str = None, kind: str = None) -> Dict:
@@ -421,17 +921,164 @@ class TickTickClient:
         if kind:
             data["kind"] = kind
             
-        return self._make_request("POST", f"/project/{project_id}", data)
+        result = self._make_request("POST", f"/project/{project_id}", data)
+        self._invalidate_project_list()
+        self.invalidate_cache(project_id)
+        return result
     
-    def delete_project(self, project_id: str) -> Dict:
-        """Deletes a project."""
-        return self._make_request("DELETE", f"/project/{project_id}")
+    def delete_project(self, project_id: str, attempts: int = 3) -> Dict:
+        """
+        Deletes a project, retrying transient failures with jittered exponential backoff.
+        
+        A 404 on a retry is treated as success, since an earlier attempt may have
+        deleted the project before its response was lost.
+        
+        Args:
+            project_id: ID of the project to delete
+            attempts: Maximum number of DELETE attempts (default: 3)
+        """
+        for attempt in range(attempts):
+            if attempt:
+                time.sleep(min(2.0, 0.2 * 2 ** (attempt - 1)) + random.uniform(0, 0.2))
+                logger.info("Retrying deletion of project %s (attempt %s/%s)", project_id, attempt + 1, attempts)
+            
+            result = self._make_request("DELETE", f"/project/{project_id}")
+            if attempt and result.get('http_status') == 404:
+                result = {
+                    "success": True,
+                    "status": "success",
+                    "message": "Project already deleted"
+                }
+                break
+            if not result.get('is_transient'):
+                break
+        
+        self._invalidate_project_list()
+        self.invalidate_cache(project_id)
+        return result
+    
+    def delete_projects(self, project_ids: list) -> Dict:
+        """
+        Delete multiple projects in one call.
+        
+        The project list is fetched once up front so unknown IDs are rejected
+        without a request. The TickTick Open API has no batch delete endpoint,
+        so the remaining DELETE requests are issued concurrently, bounded by
+        TICKTICK_DELETE_CONCURRENCY.
+        
+        Args:
+            project_ids: List of project IDs to delete
+        
+        Returns:
+            Dictionary with "succeeded" (list of {"id", "name"}) and "failed"
+            (list of {"id", "error"}), or an error dictionary if the project
+            list could not be fetched
+        """
+        projects = self.get_projects()
+        if isinstance(projects, dict) and 'error' in projects:
+            return projects
+        projects_by_id = {project.get('id'): project for project in projects}
+        
+        def delete(project_id: str) -> Dict:
+            try:
+                return self.delete_project(project_id)
+            except Exception as e:
+                return {"error": f"Failed to delete project: {str(e)}"}
+        
+        succeeded = []
+        failed = []
+        to_delete = []
+        for project_id in project_ids:
+            if project_id in projects_by_id:
+                to_delete.append(project_id)
+            else:
+                failed.append({"id": project_id, "error": "Project not found"})
+        
+        if to_delete:
+            with ThreadPoolExecutor(max_workers=min(self.delete_concurrency, len(to_delete))) as executor:
+                results = list(executor.map(delete, to_delete))
+            
+            for project_id, result in zip(to_delete, results):
+                if isinstance(result, dict) and 'error' in result:
+                    failed.append({"id": project_id, "error": result['error']})
+                else:
+                    succeeded.append({"id": project_id, "name": projects_by_id[project_id].get('name', 'Unknown Project')})
+        
+        return {"succeeded": succeeded, "failed": failed}
     
     # Task methods
     def get_task(self, project_id: str, task_id: str) -> Dict:
         """Gets a specific task by project ID and task ID."""
         return self._make_request("GET", f"/project/{project_id}/task/{task_id}")
     
+    def get_task_for_update(self, project_id: str, task_id: str) -> Dict:
+        """
+        Gets the current state of a task to base a full-object update on.
+        
+        A task just returned by update_task is reused for a few seconds so
+        back-to-back updates skip the lookup. Otherwise the task is read fresh
+        rather than from the project listing cache, so changes made elsewhere
+        since the listing was fetched are not overwritten.
+        """
+        hit = self._cache.get(("task", project_id, task_id))
+        if hit and time.monotonic() - hit[0] < self._RECENT_TASK_TTL:
+            return copy.deepcopy(hit[1])
+        return self.get_task(project_id, task_id)
+    
+    def find_task(self, project_id: str, task_id: str) -> Dict:
+        """
+        Gets a task by ID, answering from the project's cached task listing when possible.
+        
+        Back-to-back lookups in the same project share one project data fetch
+        instead of issuing a request per task. Tasks missing from the listing
+        (e.g. completed tasks) fall back to get_task. The listing is re-fetched
+        (revalidated by ETag) once it is _TASK_INDEX_TTL seconds old rather than
+        served for the full cache TTL; callers still treat a 404 from the
+        follow-up mutation as the task being gone.
+        """
+        def build() -> Dict:
+            project_data = self._make_request("GET", f"/project/{project_id}/data")
+            if 'error' in project_data:
+                return project_data
+            if self.cache_ttl > 0:
+                # Refresh the general project data cache with the fresh listing too
+                self._cache[("project_data", project_id)] = (time.monotonic(), project_data)
+            return {task['id']: task for task in project_data.get('tasks', []) if task.get('id')}
+        
+        # Share the index and copy only the task it answers with
+        index = self._cached(("task_index", project_id), build, share=True, ttl=self._TASK_INDEX_TTL)
+        if 'error' not in index and task_id in index:
+            return copy.deepcopy(index[task_id])
+        return self.get_task(project_id, task_id)
+    
+    def _prefetch_tasks(self, tasks: list, fresh: bool = False) -> Dict[Tuple[str, str], Dict]:
+        """
+        Looks up the tasks of a batch with one project data fetch per distinct project.
+        
+        Args:
+            tasks: Task dictionaries with project_id keys
+            fresh: Bypass the TTL cache, e.g. when the tasks are the base for
+                full-object updates that must not revert newer changes (default: False)
+        
+        Returns:
+            Tasks keyed by (project_id, task_id). Tasks missing from their project's
+            listing (e.g. completed ones) or from projects that failed to load are
+            left out, so callers fall back to a per-task lookup for those.
+        """
+        project_ids = list(dict.fromkeys(task["project_id"] for task in tasks))
+        if fresh:
+            for project_id in project_ids:
+                self.invalidate_cache(project_id)
+        with ThreadPoolExecutor(max_workers=min(8, len(project_ids))) as executor:
+            projects_data = list(executor.map(self.get_project_with_data, project_ids))
+        
+        found = {}
+        for project_id, project_data in zip(project_ids, projects_data):
+            if isinstance(project_data, dict) and 'error' not in project_data:
+                for task in project_data.get('tasks', []):
+                    found[(project_id, task.get('id'))] = task
+        return found
+    
     def create_task(self, title: str, project_id: str, content: str = None, 
                    start_date: str = None, due_date: str = None, 
                    priority: int = 0, is_all_day: bool = False, repeat_flag: str = None,
@@ -483,12 +1130,15 @@ class TickTickClient:
         if repeat_flag:
             data["repeatFlag"] = repeat_flag
             
-        return self._make_request("POST", "/task", data)
+        result = self._make_request("POST", "/task", data)
+        self.invalidate_cache(project_id)
+        return result
     
     def update_task(self, task_id: str, project_id: str, title: str = None, 
                    content: str = None, priority: int = None, 
                    start_date: str = None, due_date: str = None,
-                   repeat_flag: str = None, tags: list = None) -> Dict:
+                   repeat_flag: str = None, tags: list = None,
+                   current_task: Dict = None) -> Dict:
         """
         Updates an existing task with robust data preservation and tag support.
         
@@ -502,18 +1152,23 @@ class TickTickClient:
             due_date: New due date in ISO format (optional)
             repeat_flag: New recurrence rule in RRULE format (optional)
             tags: New list of tags to add to the task (optional)
+            current_task: Task data already fetched by the caller, to skip the
+                lookup used for data preservation (optional)
         
         Returns:
             Dictionary with task data or error
         """
         # First, get the current task to preserve existing data
         try:
-            current_task = self.get_task(project_id, task_id)
-            if 'error' in current_task:
-                return current_task  # Return the error
+            if current_task is None:
+                current_task = self.get_task(project_id, task_id)
+                if 'error' in current_task:
+                    return current_task  # Return the error
             
-            # Start with a complete copy of the current task data (complete data preservation)
-            data = current_task.copy()
+            # Start with a copy of the current task data (complete data preservation),
+            # leaving out server-managed or read-only fields the update must not send
+            data = {key: value for key, value in current_task.items()
+                    if key not in self._READ_ONLY_TASK_FIELDS}
             
             # Ensure ID and projectId are always correct
             data["id"] = task_id
@@ -531,26 +1186,15 @@ class TickTickClient:
                     
                     # If we're not changing the title, extract hashtags from current title
                     if title is None and "#" in new_title:
-                        # This is a simple extraction that assumes tags are at the end of the title
-                        # A more complex implementation might use regex to extract all hashtags
-                        words = new_title.split()
-                        non_tag_words = []
-                        
-                        for word in words:
-                            if word.startswith("#"):
-                                existing_tags.append(word)
-                            else:
-                                non_tag_words.append(word)
+                        existing_tags = _HASHTAG_RE.findall(new_title)
                         
                         # Reconstruct the base title without tags
-                        if non_tag_words:
-                            new_title = " ".join(non_tag_words)
+                        base_title = " ".join(_HASHTAG_RE.sub("", new_title).split())
+                        if base_title:
+                            new_title = base_title
                     
-                    # Format new tags with hashtags
-                    formatted_tags = [f"#{tag.strip('#')}" for tag in tags]
-                    
-                    # Combine with existing tags and deduplicate
-                    all_tags = list(set(existing_tags + formatted_tags))
+                    # Combine with the new tags, deduplicating while keeping their order
+                    all_tags = dict.fromkeys(existing_tags + [f"#{tag.strip('#')}" for tag in tags])
                     tag_string = " ".join(all_tags)
                     
                     # Create new title with tags
@@ -560,44 +1204,36 @@ class TickTickClient:
                 data["title"] = new_title.strip()
             
             # Update other fields if explicitly provided
-            if content is not None:
-                data["content"] = content
-                
-            if priority is not None:
-                data["priority"] = priority
-                
-            if start_date is not None:
-                data["startDate"] = start_date
-                
-            if due_date is not None:
-                data["dueDate"] = due_date
-                
-            if repeat_flag is not None:
-                data["repeatFlag"] = repeat_flag
-            
-            # Remove any fields that shouldn't be included in the update request
-            # These fields are typically server-managed or read-only
-            fields_to_remove = [
-                "createdTime", "completedTime", "modifiedTime", 
-                "etag", "timeZone", "sortOrder"
-            ]
-            
-            for field in fields_to_remove:
-                if field in data:
-                    data.pop(field)
+            data.update({
+                api_key: value for api_key, value in (
+                    ("content", content),
+                    ("priority", priority),
+                    ("startDate", start_date),
+                    ("dueDate", due_date),
+                    ("repeatFlag", repeat_flag),
+                ) if value is not None
+            })
             
             # Log the update data for debugging
-            logger.debug(f"Updating task {task_id} with preserved data: {json.dumps(data, indent=2)}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Updating task %s with preserved data: %s", task_id, _json_dumps(data).decode("utf-8"))
             
-            return self._make_request("POST", f"/task/{task_id}", data)
+            result = self._make_request("POST", f"/task/{task_id}", data)
+            self.invalidate_cache(project_id)
+            if self.cache_ttl > 0 and isinstance(result, dict) and 'error' not in result and result.get('id') == task_id:
+                # The response is the updated task; keep it for a follow-up update
+                self._cache[("task", project_id, task_id)] = (time.monotonic(), copy.deepcopy(result))
+            return result
             
         except Exception as e:
-            logger.error(f"Error updating task {task_id}: {e}")
+            logger.error("Error updating task %s: %s", task_id, e)
             return {"error": f"Failed to update task: {str(e)}"}
     
     def complete_task(self, project_id: str, task_id: str) -> Dict:
         """Marks a task as complete."""
-        return self._make_request("POST", f"/project/{project_id}/task/{task_id}/complete")
+        result = self._make_request("POST", f"/project/{project_id}/task/{task_id}/complete")
+        self.invalidate_cache(project_id)
+        return result
         
     def complete_tasks(self, tasks: list) -> Dict:
         """
@@ -640,6 +1276,7 @@ class TickTickClient:
             # TickTick doesn't have a batch completion endpoint that we're aware of
             results = []
             successful_count = 0
+            known_tasks = self._prefetch_tasks(tasks)
             
             for i, task in enumerate(tasks):
                 try:
@@ -650,7 +1287,7 @@ class TickTickClient:
                     # Get task details before completion for the response
                     task_details = None
                     try:
-                        task_details = self.get_task(project_id, task_id)
+                        task_details = known_tasks.get((project_id, task_id)) or self.get_task(project_id, task_id)
                         task_title = task_details.get('title', 'Unknown Task')
                     except Exception:
                         task_title = "Unknown Task"
@@ -698,14 +1335,14 @@ class TickTickClient:
                                     result["message"] = "Task completion verified successfully"
                                     result["completion_time"] = updated_task.get('completedTime', 'Unknown')
                         except Exception as verify_error:
-                            logger.warning(f"Error verifying task completion: {verify_error}")
+                            logger.warning("Error verifying task completion: %s", verify_error)
                             result["status"] = "warning"
                             result["message"] = "Task completion processed but verification failed"
                             result["verification_error"] = str(verify_error)
                     
                     results.append(result)
                 except Exception as e:
-                    logger.error(f"Error completing task at position {i}: {str(e)}")
+                    logger.error("Error completing task at position %s: %s", i, e)
                     results.append({
                         "error": f"Failed to complete task: {str(e)}",
                         "error_code": "COMPLETION_ERROR",
@@ -725,7 +1362,7 @@ class TickTickClient:
             }
             
         except Exception as e:
-            logger.error(f"Error in batch task completion: {str(e)}")
+            logger.error("Error in batch task completion: %s", e)
             return {
                 "error": f"Failed to process batch task completion: {str(e)}",
                 "error_code": "BATCH_COMPLETION_ERROR",
@@ -777,6 +1414,7 @@ class TickTickClient:
             # so we perform individual updates but present them as a batch
             results = []
             successful_count = 0
+            known_tasks = self._prefetch_tasks(tasks, fresh=True)
             
             for i, task in enumerate(tasks):
                 try:
@@ -803,7 +1441,8 @@ class TickTickClient:
                         due_date=due_date,
                         priority=priority,
                         repeat_flag=repeat_flag,
-                        tags=tags
+                        tags=tags,
+                        current_task=known_tasks.get((project_id, task_id))
                     )
                     
                     # Add task index for reference
@@ -828,7 +1467,7 @@ class TickTickClient:
                         
                     results.append(result)
                 except Exception as e:
-                    logger.error(f"Error updating task at position {i}: {str(e)}")
+                    logger.error("Error updating task at position %s: %s", i, e)
                     results.append({
                         "error": f"Failed to update task: {str(e)}",
                         "error_code": "UPDATE_ERROR",
@@ -848,14 +1487,14 @@ class TickTickClient:
             }
             
         except Exception as e:
-            logger.error(f"Error in batch task update: {str(e)}")
+            logger.error("Error in batch task update: %s", e)
             return {
                 "error": f"Failed to process batch task update: {str(e)}",
                 "error_code": "BATCH_UPDATE_ERROR",
                 "status": "failed"
             }
     
-    def create_tasks(self, tasks: list) -> List[Dict]:
+    def create_tasks(self, tasks: list, skip_duplicates: bool = False) -> List[Dict]:
         """
         Create multiple tasks in a single operation.
         
@@ -869,6 +1508,9 @@ class TickTickClient:
                 - priority: Priority level (optional)
                 - tags: List of tags (optional)
                 - repeat_flag: Recurrence rule (optional)
+            skip_duplicates: Create only the first of any tasks that are identical once
+                formatted for the API; the rest are reported under skipped_duplicates
+                and still counted in total_count (default: False)
             
         Returns:
             List of created task objects or error
@@ -879,7 +1521,12 @@ class TickTickClient:
                         "error_code": "INVALID_INPUT",
                         "status": "failed"}
             
-            # Validate each task has the required fields
+            # Validate and format tasks for the API in a single pass, optionally
+            # dropping exact repeats so a retried or doubled request doesn't create copies
+            formatted_tasks = []
+            unique_indices = []
+            seen = {}
+            skipped_duplicates = []
             for i, task in enumerate(tasks):
                 if not isinstance(task, dict):
                     return {"error": f"Invalid task at position {i}: must be a dictionary", 
@@ -893,111 +1540,124 @@ class TickTickClient:
                     return {"error": f"Invalid task at position {i}: missing required field 'project_id'", 
                             "error_code": "MISSING_REQUIRED_FIELD",
                             "status": "failed"}
-            
-            # Format tasks for the API
-            formatted_tasks = []
-            for task in tasks:
+                for field in ("title", "project_id"):
+                    if not isinstance(task[field], str) or not task[field].strip():
+                        return {"error": f"Invalid task at position {i}: '{field}' must be a non-empty string", 
+                                "error_code": "INVALID_FIELD_VALUE",
+                                "status": "failed"}
+                
                 formatted_task = {
                     "title": task["title"],
                     "projectId": task["project_id"]
                 }
                 
                 # Process tags if provided
-                if "tags" in task and task["tags"] and isinstance(task["tags"], list):
-                    formatted_tags = [f"#{tag.strip('#')}" for tag in task["tags"]]
-                    tag_string = " ".join(formatted_tags)
+                tags = task.get("tags")
+                if tags and isinstance(tags, list):
+                    tag_string = " ".join(f"#{tag.strip('#')}" for tag in tags)
                     formatted_task["title"] = f"{formatted_task['title']} {tag_string}"
                 
-                # Add optional fields
-                if "content" in task and task["content"]:
-                    formatted_task["content"] = task["content"]
-                    
-                if "start_date" in task and task["start_date"]:
-                    formatted_task["startDate"] = task["start_date"]
-                    
-                if "due_date" in task and task["due_date"]:
-                    formatted_task["dueDate"] = task["due_date"]
-                    
-                if "priority" in task:
-                    formatted_task["priority"] = task["priority"]
-                    
-                if "repeat_flag" in task and task["repeat_flag"]:
-                    formatted_task["repeatFlag"] = task["repeat_flag"]
-                    
-                if "is_all_day" in task:
-                    formatted_task["isAllDay"] = task["is_all_day"]
+                # Add optional fields: text fields when non-empty, flags whenever given
+                for field, api_key in self._BATCH_TASK_TEXT_FIELDS:
+                    value = task.get(field)
+                    if value:
+                        formatted_task[api_key] = value
+                for field, api_key in self._BATCH_TASK_FLAG_FIELDS:
+                    if field in task:
+                        formatted_task[api_key] = task[field]
                 
+                if skip_duplicates:
+                    key = json.dumps(formatted_task, sort_keys=True, default=str)
+                    if key in seen:
+                        skipped_duplicates.append({"task_index": i, "duplicate_of": seen[key]})
+                        continue
+                    seen[key] = i
+                unique_indices.append(i)
                 formatted_tasks.append(formatted_task)
+            skipped_note = ""
+            if skipped_duplicates:
+                logger.info("Skipping %s duplicate tasks in batch", len(skipped_duplicates))
+                skipped_note = f" ({len(skipped_duplicates)} duplicates skipped)"
             
             # Try batch endpoint first
             try:
                 batch_data = {"add": formatted_tasks}
-                logger.info(f"Attempting batch creation of {len(formatted_tasks)} tasks")
+                logger.info("Attempting batch creation of %s tasks", len(formatted_tasks))
                 response = self._make_request("POST", "/batch/task", batch_data)
+                for project_id in {task["project_id"] for task in tasks}:
+                    self.invalidate_cache(project_id)
                 
                 # If successful, return the created tasks
                 if "error" not in response and response.get("status") != "failed":
                     created_tasks = response.get("add", [])
-                    logger.info(f"Successfully created {len(created_tasks)} tasks in batch")
+                    logger.info("Successfully created %s tasks in batch", len(created_tasks))
                     return {
                         "status": "success",
-                        "message": f"Successfully created {len(created_tasks)} tasks in batch",
-                        "tasks": created_tasks
+                        "message": f"Successfully created {len(created_tasks)} tasks in batch{skipped_note}",
+                        "tasks": created_tasks,
+                        "total_count": len(tasks),
+                        "skipped_duplicates": skipped_duplicates
                     }
                 else:
-                    logger.warning(f"Batch task creation failed: {response.get('error', 'Unknown error')}")
+                    logger.warning("Batch task creation failed: %s", response.get('error', 'Unknown error'))
                     logger.info("Falling back to individual task creation")
             except Exception as e:
-                logger.warning(f"Batch endpoint failed: {str(e)}")
+                logger.warning("Batch endpoint failed: %s", e)
                 logger.info("Falling back to individual task creation")
             
-            # Fallback to individual creation
-            logger.info(f"Creating {len(tasks)} tasks individually")
-            results = []
-            successful_count = 0
+            # Fallback to individual creation, issued concurrently since each
+            # request is independent (writes are still paced by the rate limiter)
+            logger.info("Creating %s tasks individually", len(unique_indices))
+            if _BATCH_FALLBACKS is not None:
+                _BATCH_FALLBACKS.inc()
             
-            for i, task in enumerate(tasks):
+            create_task = self.create_task
+            
+            def create(i: int, task: Dict) -> Dict:
+                get = task.get
                 try:
-                    result = self.create_task(
+                    result = create_task(
                         title=task["title"],
                         project_id=task["project_id"],
-                        content=task.get("content"),
-                        start_date=task.get("start_date"),
-                        due_date=task.get("due_date"),
-                        priority=task.get("priority", 0),
-                        is_all_day=task.get("is_all_day", False),
-                        repeat_flag=task.get("repeat_flag"),
-                        tags=task.get("tags")
+                        content=get("content"),
+                        start_date=get("start_date"),
+                        due_date=get("due_date"),
+                        priority=get("priority", 0),
+                        is_all_day=get("is_all_day", False),
+                        repeat_flag=get("repeat_flag"),
+                        tags=get("tags")
                     )
                     
                     if "error" in result:
                         # Add task index for better error reporting
                         result["task_index"] = i
                         result["task_data"] = task
-                    else:
-                        successful_count += 1
-                        
-                    results.append(result)
+                    return result
                 except Exception as e:
-                    logger.error(f"Error creating task at position {i}: {str(e)}")
-                    results.append({
+                    logger.error("Error creating task at position %s: %s", i, e)
+                    return {
                         "error": f"Failed to create task: {str(e)}",
                         "task_index": i,
                         "task_data": task,
                         "status": "failed"
-                    })
+                    }
+            
+            with ThreadPoolExecutor(max_workers=min(8, len(unique_indices))) as executor:
+                results = list(executor.map(create, unique_indices, [tasks[i] for i in unique_indices]))
+            successful_count = sum(1 for result in results if "error" not in result)
             
             # Return combined results
             return {
-                "status": "partial" if successful_count < len(tasks) else "success",
-                "message": f"Created {successful_count} out of {len(tasks)} tasks",
+                "status": "partial" if successful_count < len(results) else "success",
+                "message": f"Created {successful_count} out of {len(tasks)} tasks{skipped_note}",
                 "tasks": results,
                 "successful_count": successful_count,
-                "total_count": len(tasks)
+                "total_count": len(tasks),
+                "skipped_duplicates": skipped_duplicates
             }
             
         except Exception as e:
-            logger.error(f"Error in batch task creation: {str(e)}")
+            logger.error("Error in batch task creation: %s", e)
             return {
                 "error": f"Failed to process batch task creation: {str(e)}",
                 "error_code": "BATCH_PROCESSING_ERROR",
@@ -1053,6 +1713,7 @@ class TickTickClient:
             # Process deletions individually
             results = []
             successful_count = 0
+            known_tasks = self._prefetch_tasks(tasks)
             
             for i, task in enumerate(tasks):
                 try:
@@ -1063,13 +1724,16 @@ class TickTickClient:
                     # Get task details before deletion for the response
                     task_details = None
                     try:
-                        task_details = self.get_task(project_id, task_id)
+                        task_details = known_tasks.get((project_id, task_id)) or self.find_task(project_id, task_id)
                         task_title = task_details.get('title', 'Unknown Task')
                     except Exception:
                         task_title = "Unknown Task"
                     
-                    # Use existing delete_task method
-                    result = self.delete_task(project_id, task_id)
+                    # Use existing delete_task method, reusing the lookup above
+                    result = self.delete_task(
+                        project_id, task_id,
+                        task=task_details if task_details and 'error' not in task_details else None
+                    )
                     
                     # Process result
                     if isinstance(result, dict) and result.get('status') == 'failed' and 'error' in result:
@@ -1093,7 +1757,7 @@ class TickTickClient:
                     
                     results.append(result)
                 except Exception as e:
-                    logger.error(f"Error deleting task at position {i}: {str(e)}")
+                    logger.error("Error deleting task at position %s: %s", i, e)
                     results.append({
                         "error": f"Failed to delete task: {str(e)}",
                         "error_code": "DELETION_ERROR",
@@ -1113,28 +1777,39 @@ class TickTickClient:
             }
             
         except Exception as e:
-            logger.error(f"Error in batch task deletion: {str(e)}")
+            logger.error("Error in batch task deletion: %s", e)
             return {
                 "error": f"Failed to process batch task deletion: {str(e)}",
                 "error_code": "BATCH_DELETION_ERROR",
                 "status": "failed"
             }
     
-    def delete_task(self, project_id: str, task_id: str, retry_count: int = 1) -> Dict:
+    def delete_task(self, project_id: str, task_id: str, retry_count: int = 1,
+                    task: Dict = None, verify: bool = False) -> Dict:
         """
-        Deletes a task with enhanced error handling and verification.
+        Deletes a task with enhanced error handling and optional verification.
         
         Args:
             project_id: ID of the project containing the task
             task_id: ID of the task to delete
-            retry_count: Number of retry attempts for transient errors (default: 1)
+            retry_count: Number of retry attempts for transient errors, with exponential
+                backoff and jitter between attempts (default: 1)
+            task: Task data already fetched by the caller, to skip the existence
+                lookup (optional)
+            verify: Re-fetch the task after deletion to confirm it is gone (default: False)
         
         Returns:
             Dictionary with operation result
         """
         try:
-            # Verify project exists first
-            project = self.get_project(project_id)
+            # A caller-supplied task already proves the task (and so the project)
+            # exists; reuse whatever project data is cached instead of fetching it
+            if task is not None:
+                cached_project = self._cache.get(("project", project_id))
+                project = cached_project[1] if cached_project else {}
+            else:
+                # Verify project exists first
+                project = self.get_project(project_id)
             if 'error' in project:
                 error_code = 'PROJECT_NOT_FOUND'
                 error_msg = f"Cannot delete task: Project not found - {project['error']}"
@@ -1147,9 +1822,10 @@ class TickTickClient:
                 }
             
             # Verify task exists before attempting to delete
-            task = self.get_task(project_id, task_id)
+            if task is None:
+                task = self.find_task(project_id, task_id)
             if 'error' in task:
-                error_code = 'TASK_NOT_FOUND' if "404" in str(task.get('error', '')) else 'TASK_FETCH_ERROR'
+                error_code = 'TASK_NOT_FOUND' if task.get('http_status') == 404 else 'TASK_FETCH_ERROR'
                 error_msg = f"Cannot delete task: {task['error']}"
                 logger.error(error_msg)
                 return {
@@ -1168,19 +1844,47 @@ class TickTickClient:
             }
             
             # Task exists, proceed with deletion
-            logger.info(f"Deleting task '{task.get('title', 'Unknown')}' (ID: {task_id}) from project '{project.get('name', 'Unknown')}' (ID: {project_id})")
-            result = self._make_request("DELETE", f"/project/{project_id}/task/{task_id}")
+            logger.info("Deleting task '%s' (ID: %s) from project '%s' (ID: %s)", task.get('title', 'Unknown'), task_id, project.get('name', 'Unknown'), project_id)
+            for attempt in range(retry_count + 1):
+                result = self._make_request("DELETE", f"/project/{project_id}/task/{task_id}")
+                self.invalidate_cache(project_id)
+                
+                if attempt > 0 and result.get('http_status') == 404:
+                    # An earlier attempt went through before its response was lost
+                    result = {"status": "success"}
+                if 'error' not in result:
+                    break
+                
+                # If we encounter a recoverable error and have retries left, back off and retry
+                if attempt < retry_count and _RECOVERABLE_ERROR_RE.search(str(result['error'])):
+                    delay = min(30.0, 2 ** attempt * (1 + random.uniform(0, 0.5)))
+                    # The server's own back-off is authoritative; give up if it is too long to wait out
+                    retry_after = str(result.get('retry_after', ''))
+                    if retry_after.isdigit():
+                        if int(retry_after) > 30:
+                            break
+                        delay = max(delay, float(retry_after))
+                    logger.warning("Encountered recoverable error: %s. Retrying in %.1fs... (%s attempts left)", result['error'], delay, retry_count - attempt)
+                    if _RETRIES is not None:
+                        _RETRIES.labels("delete_task").inc()
+                    time.sleep(delay)
+                    continue
+                break
             
             # Handle API errors
+            if result.get('http_status') == 404:
+                # Removed since the caller looked it up
+                logger.error("Failed to delete task %s: %s", task_id, result['error'])
+                return {
+                    "error": f"Cannot delete task: {result['error']}",
+                    "error_code": "TASK_NOT_FOUND",
+                    "status": "failed",
+                    "http_status": 404,
+                    "task_details": task_details
+                }
             if 'error' in result:
-                # If we encounter a recoverable error and have retries left, retry the operation
-                recoverable_errors = ["timeout", "rate limit", "server error", "500", "503"]
-                if any(err in str(result['error']).lower() for err in recoverable_errors) and retry_count > 0:
-                    logger.warning(f"Encountered recoverable error: {result['error']}. Retrying... ({retry_count} attempts left)")
-                    return self.delete_task(project_id, task_id, retry_count - 1)
-                
                 # Not recoverable or out of retries
-                logger.error(f"Failed to delete task {task_id}: {result['error']}")
+                logger.error("Failed to delete task %s: %s", task_id, result['error'])
                 return {
                     "error": f"API error while deleting task: {result['error']}",
                     "error_code": "API_ERROR",
@@ -1188,11 +1892,21 @@ class TickTickClient:
                     "task_details": task_details
                 }
             
+            if not verify:
+                # The DELETE succeeded; trust it rather than paying for another round trip
+                logger.info("Successfully deleted task %s from project %s", task_id, project_id)
+                return {
+                    "success": True,
+                    "status": "success",
+                    "message": f"Task '{task_details['title']}' deleted successfully",
+                    "task_details": task_details
+                }
+            
             # Verify deletion was successful by checking if task still exists
             verification = self.get_task(project_id, task_id)
             if 'error' in verification and "404" in str(verification.get('error', '')):
                 # Task not found after deletion, this is expected - success!
-                logger.info(f"Successfully deleted task {task_id} from project {project_id}")
+                logger.info("Successfully deleted task %s from project %s", task_id, project_id)
                 return {
                     "success": True,
                     "status": "success",
@@ -1201,7 +1915,7 @@ class TickTickClient:
                 }
             elif 'error' in verification:
                 # Some other error occurred during verification
-                logger.warning(f"Task deletion verification failed: {verification['error']}")
+                logger.warning("Task deletion verification failed: %s", verification['error'])
                 return {
                     "status": "warning",
                     "message": f"Task deletion reported as successful, but verification failed: {verification['error']}",
@@ -1210,7 +1924,7 @@ class TickTickClient:
                 }
             else:
                 # Task still exists but deletion was processed by API
-                logger.info(f"Task {task_id} still exists after deletion request - likely due to API sync delay")
+                logger.info("Task %s still exists after deletion request - likely due to API sync delay", task_id)
                 return {
                     "message": "Task deletion processed successfully. The task may still be accessible via direct API for some time due to TickTick's caching.",
                     "warning_code": "DELETION_SYNC_DELAY",
@@ -1220,7 +1934,7 @@ class TickTickClient:
                 }
             
         except Exception as e:
-            logger.error(f"Unexpected error deleting task {task_id}: {e}")
+            logger.error("Unexpected error deleting task %s: %s", task_id, e)
             return {
                 "error": f"Failed to delete task: {str(e)}",
                 "error_code": "UNEXPECTED_ERROR",